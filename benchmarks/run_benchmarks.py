@@ -0,0 +1,263 @@
+"""
+Times the main constructors of manim_chemistry and writes the results as JSON.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --sizes 100 1000 --only mol_parser
+    python benchmarks/run_benchmarks.py --parser-sizes 50000 100000
+
+Each result records the benchmark name, its input, the input size (atoms,
+electrons...), every measured time in seconds and their minimum and mean, so
+results of different releases can be compared and plotted against size.
+Parser benchmarks also run on the larger --parser-sizes molecules, which
+would take too long to draw, next to the line by line parser they replaced
+(reference_parser.py), and the speedup of mol_parser over it is reported for
+every input.
+Benchmarks that fail (for example because manim is not installed) are
+recorded with their error instead of stopping the run.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from reference_parser import reference_mol_parser
+from synthetic import honeycomb_molecule, write_mol_file
+
+repository_path = Path(__file__).absolute().parent.parent
+element_files_path = repository_path / "examples/element_files"
+elements_path = repository_path / "assets/Elements_EN.csv"
+
+BUNDLED_MOLECULES = ["dimethylpropane.mol", "morphine.mol", "heme_group.mol"]
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_PARSER_SIZES = [50000]
+
+
+def time_call(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def molecule_inputs(sizes, directory):
+    """
+    Yields (input name, number of atoms, path) for the bundled .mol files
+    and for synthetic honeycomb molecules of the given sizes.
+    """
+    from manim_chemistry import mol_parser
+
+    for name in BUNDLED_MOLECULES:
+        path = element_files_path / name
+        yield name, len(mol_parser(path)[0]), path
+
+    yield from synthetic_inputs(sizes, directory)
+
+
+def synthetic_inputs(sizes, directory):
+    for size in sizes:
+        path = Path(directory) / f"honeycomb_{size}.mol"
+        write_mol_file(path, *honeycomb_molecule(size))
+        yield f"honeycomb_{size}", size, path
+
+
+def bench_mol_parser(molecules):
+    from manim_chemistry import mol_parser
+
+    for name, size, path in molecules:
+        yield name, size, lambda path=path: mol_parser(path)
+
+
+def bench_reference_mol_parser(molecules):
+    for name, size, path in molecules:
+        yield name, size, lambda path=path: reference_mol_parser(path)
+
+
+def bench_mol_array_parser(molecules):
+    from manim_chemistry import mol_array_parser
+
+    for name, size, path in molecules:
+        yield name, size, lambda path=path: mol_array_parser(path)
+
+
+def bench_mmolecule_from_mol_file(molecules):
+    from manim_chemistry import MMoleculeObject
+
+    for name, size, path in molecules:
+        yield name, size, lambda path=path: MMoleculeObject.from_mol_file(path)
+
+
+def bench_threedmolecule_from_mol_file(molecules):
+    from manim_chemistry import ThreeDMolecule
+
+    for name, size, path in molecules:
+        yield name, size, lambda path=path: ThreeDMolecule.from_mol_file(
+            path, elements_path
+        )
+
+
+def bench_periodic_table(molecules):
+    from manim_chemistry import PeriodicTable
+
+    yield "Elements_EN.csv", 118, lambda: PeriodicTable(elements_path)
+
+
+def bench_chemical_text(molecules):
+    from manim_chemistry import MChemicalText
+
+    for phrases in (["CHemistry"], ["Manim", "Chemistry", "Benchmarks"]):
+        size = sum(len(phrase) for phrase in phrases)
+        yield " ".join(phrases), size, lambda phrases=phrases: MChemicalText(phrases)
+
+
+def bench_orbital(molecules):
+    from manim_chemistry import Orbital
+
+    for l, m in ((0, 0), (1, 0), (2, 1), (3, -2)):
+        yield f"l={l}, m={m}", l, lambda l=l, m=m: Orbital(l=l, m=m)
+
+
+def bench_bohr_atom(molecules):
+    from manim_chemistry import BohrAtom
+
+    for electrons in (2, 14, 54, 118):
+        yield f"e={electrons}", electrons, lambda electrons=electrons: BohrAtom(
+            e=electrons, p=electrons, n=electrons
+        )
+
+
+BENCHMARKS = {
+    "mol_parser": bench_mol_parser,
+    "reference_mol_parser": bench_reference_mol_parser,
+    "mol_array_parser": bench_mol_array_parser,
+    "MMoleculeObject.from_mol_file": bench_mmolecule_from_mol_file,
+    "ThreeDMolecule.from_mol_file": bench_threedmolecule_from_mol_file,
+    "PeriodicTable": bench_periodic_table,
+    "MChemicalText": bench_chemical_text,
+    "Orbital": bench_orbital,
+    "BohrAtom": bench_bohr_atom,
+}
+# Benchmarks that also run on the --parser-sizes molecules
+PARSER_BENCHMARKS = {"mol_parser", "reference_mol_parser", "mol_array_parser"}
+
+
+def run_benchmark(name, benchmark, molecules, repeat):
+    results = []
+    try:
+        for input_name, size, function in benchmark(molecules):
+            times = time_call(function, repeat)
+            results.append(
+                {
+                    "benchmark": name,
+                    "input": input_name,
+                    "size": size,
+                    "times": times,
+                    "min": min(times),
+                    "mean": sum(times) / len(times),
+                }
+            )
+            print(f"{name:32} {input_name:28} {min(times):10.4f} s", file=sys.stderr)
+
+    except Exception as error:
+        results.append(
+            {
+                "benchmark": name,
+                "error": f"{type(error).__name__}: {error}",
+                "traceback": traceback.format_exc(),
+            }
+        )
+        print(f"{name:32} failed: {error}", file=sys.stderr)
+
+    return results
+
+
+def parser_speedups(results):
+    """
+    Returns, for every input timed by both parsers, how many times faster
+    mol_parser is than the reference parser.
+    """
+    minimums = {
+        (result["benchmark"], result["input"]): result["min"]
+        for result in results
+        if "min" in result
+    }
+    speedups = {}
+    for (name, input_name), reference_time in minimums.items():
+        parser_time = minimums.get(("mol_parser", input_name))
+        if name == "reference_mol_parser" and parser_time:
+            speedups[input_name] = reference_time / parser_time
+            print(
+                f"{'mol_parser speedup':32} {input_name:28} {speedups[input_name]:10.1f} x",
+                file=sys.stderr,
+            )
+
+    return speedups
+
+
+def metadata():
+    try:
+        from manim_chemistry import __version__
+    except ImportError:
+        __version__ = "unknown"
+
+    return {
+        "manim_chemistry": __version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "date": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--parser-sizes", type=int, nargs="*", default=DEFAULT_PARSER_SIZES
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", choices=list(BENCHMARKS))
+    arguments = parser.parse_args(arguments)
+
+    results = []
+    selected = arguments.only or list(BENCHMARKS)
+    with tempfile.TemporaryDirectory() as directory:
+        molecules = list(molecule_inputs(arguments.sizes, directory))
+        parser_molecules = molecules
+        if PARSER_BENCHMARKS.intersection(selected):
+            parser_molecules = molecules + list(
+                synthetic_inputs(arguments.parser_sizes, directory)
+            )
+        for name in selected:
+            results += run_benchmark(
+                name,
+                BENCHMARKS[name],
+                parser_molecules if name in PARSER_BENCHMARKS else molecules,
+                arguments.repeat,
+            )
+
+    with open(arguments.output, "w") as file:
+        json.dump(
+            {
+                "metadata": metadata(),
+                "results": results,
+                "parser_speedups": parser_speedups(results),
+            },
+            file,
+            indent=2,
+        )
+
+
+if __name__ == "__main__":
+    main()
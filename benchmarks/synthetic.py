@@ -0,0 +1,94 @@
+"""
+Synthetic molecules used by the benchmarks.
+
+Molecules are honeycomb sheets (like graphene) drawn with 2D coordinates,
+so they look like fused rings when rendered. Vertical bonds are double bonds
+and every seventh atom is a nitrogen or an oxygen, so the benchmarks also
+exercise double bonds and atom labels.
+"""
+import math
+
+import numpy as np
+
+BOND_LENGTH = 0.825
+
+
+def honeycomb_molecule(number_of_atoms):
+    """
+    Returns the atoms and bonds dicts of a honeycomb sheet with
+    number_of_atoms atoms, with the same structure mol_parser returns.
+    """
+    columns = max(2, math.ceil(math.sqrt(number_of_atoms)))
+    atoms = {}
+    bonds = {}
+
+    def atom_index(column, row):
+        index = row * columns + column + 1
+        return index if column < columns and index <= number_of_atoms else None
+
+    for index in range(1, number_of_atoms + 1):
+        row, column = divmod(index - 1, columns)
+        x = column * math.sqrt(3) / 2 * BOND_LENGTH
+        y = (row * 1.5 + 0.5 * ((row + column) % 2)) * BOND_LENGTH
+        element = "C"
+        if index % 7 == 0:
+            element = "N" if index % 14 else "O"
+        atoms[index] = {"coords": np.array([x, y, 0.0]), "element": element}
+
+    for index, atom in atoms.items():
+        row, column = divmod(index - 1, columns)
+        neighbours = [(atom_index(column + 1, row), "1")]
+        if (row + column) % 2 == 0:
+            neighbours.append((atom_index(column, row + 1), "2"))
+
+        for to_index, bond_type in neighbours:
+            if to_index is None:
+                continue
+            bonds.setdefault(index, []).append(
+                {
+                    "to": to_index,
+                    "type": bond_type,
+                    "stereo": 0,
+                    "topology": 0,
+                    "reacting_center_status": 0,
+                }
+            )
+            atom.setdefault("bond_to", {})[to_index] = atoms[to_index]["element"]
+            atoms[to_index].setdefault("bond_to", {})[index] = atom["element"]
+
+    return atoms, bonds
+
+
+def write_mol_file(filename, atoms, bonds):
+    """
+    Writes atoms and bonds dicts as a V2000 .mol file. Atom lines always use
+    the standard fixed columns. Counts and bond fields are separated by
+    spaces when they don't fit in three characters.
+    """
+    number_of_bonds = sum(len(bond_list) for bond_list in bonds.values())
+
+    def fields(*values):
+        if max(values) < 100:
+            return "".join(f"{value:>3}" for value in values)
+        return " ".join(str(value) for value in values)
+
+    lines = [
+        "synthetic",
+        "  manim_chemistry benchmarks",
+        "",
+        f"{fields(len(atoms), number_of_bonds)}  0  0  0  0            999 V2000",
+    ]
+    for atom in atoms.values():
+        x, y, z = atom["coords"]
+        lines.append(
+            f"{x:>10.4f}{y:>10.4f}{z:>10.4f} {atom['element']:<3} 0  0  0  0  0  0  0  0  0  0  0  0"
+        )
+    for from_index, bond_list in bonds.items():
+        for bond in bond_list:
+            lines.append(
+                fields(from_index, bond["to"], int(bond["type"]), bond["stereo"], 0, 0, 0)
+            )
+    lines.append("M  END")
+
+    with open(filename, "w") as file:
+        file.write("\n".join(lines) + "\n")
@@ -1,12 +1,4 @@
-from .element import *
-from .periodic_table import *
-from .threeD import *
-from .twoD import *
-from .orbitals import *
-from .bohr_atom import *
-from .utils import *
-from .chemical_text import *
-
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
 
 try:
@@ -14,3 +6,94 @@ try:
 except PackageNotFoundError:
     # package is not installed
     __version__ = "unknown"
+
+# Public names and the subpackage that defines them. Subpackages are only
+# imported the first time one of their names is used, so a scene that only
+# draws 2D molecules doesn't pay for scipy (orbitals) or OpenGL (threeD).
+_lazy_exports = {
+    "Element": ".element",
+    "ElementTable": ".element",
+    "get_element_table": ".element",
+    "clear_element_tables": ".element",
+    "MElementObject": ".periodic_table",
+    "MElementWithPositions": ".periodic_table",
+    "MElementGroup": ".periodic_table",
+    "PeriodicTable": ".periodic_table",
+    "PositionFinder": ".periodic_table",
+    "PositionTransformer": ".periodic_table",
+    "ReplicatedElement": ".periodic_table",
+    "ThreeDAtom": ".threeD",
+    "ThreeDBond": ".threeD",
+    "ThreeDMolecule": ".threeD",
+    "MAtomObject": ".twoD",
+    "BaseMBondObject": ".twoD",
+    "SimpleBond": ".twoD",
+    "DoubleBond": ".twoD",
+    "TripleBond": ".twoD",
+    "MMoleculeObject": ".twoD",
+    "NamedMolecule": ".twoD",
+    "clear_molecule_prototypes": ".twoD",
+    "get_label": ".twoD",
+    "get_number_label": ".twoD",
+    "clear_labels": ".twoD",
+    "Orbital": ".orbitals",
+    "BohrAtom": ".bohr_atom",
+    "mol_parser": ".utils",
+    "mol_block_parser": ".utils",
+    "mol_array_parser": ".utils",
+    "mol_block_array_parser": ".utils",
+    "MoleculeArrays": ".utils",
+    "get_symbol_to_atomic_number": ".utils",
+    "sdf_parser": ".utils",
+    "SDFRecord": ".utils",
+    "pdb_parser": ".utils",
+    "mmcif_parser": ".utils",
+    "xyz_parser": ".utils",
+    "find_bonds": ".utils",
+    "perceive_bonds": ".utils",
+    "find_rings": ".utils",
+    "cached_mol_array_parser": ".utils",
+    "clear_molecule_cache": ".utils",
+    "molecule_cache_stats": ".utils",
+    "load_molecules": ".utils",
+    "LoadedMolecule": ".utils",
+    "MChemicalText": ".chemical_text",
+    "BuildProfile": ".instrumentation",
+    "profile_build": ".instrumentation",
+}
+
+__all__ = list(_lazy_exports)
+
+# Subpackages, also imported the first time they are used as attributes
+# (manim_chemistry.twoD.MMoleculeObject).
+_subpackages = (
+    "animations",
+    "bohr_atom",
+    "cache",
+    "chemical_text",
+    "element",
+    "instrumentation",
+    "orbitals",
+    "periodic_table",
+    "threeD",
+    "twoD",
+    "utils",
+)
+
+
+def __getattr__(name):
+    if name in _subpackages:
+        return import_module(f".{name}", __name__)
+
+    module_name = _lazy_exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_subpackages))
@@ -0,0 +1 @@
+from .cache import get_cache_dir, file_hash, save_arrays, load_arrays
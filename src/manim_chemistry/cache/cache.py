@@ -0,0 +1,83 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+
+def get_cache_dir(*subdirectories: str) -> Path or None:
+    """
+    Returns the directory where manim_chemistry keeps its caches, creating
+    it if needed. It can be changed with the MANIM_CHEMISTRY_CACHE_DIR
+    environment variable and disabled with MANIM_CHEMISTRY_NO_CACHE=1.
+
+    Returns None if caching is disabled or the directory can't be created.
+    """
+    if os.environ.get("MANIM_CHEMISTRY_NO_CACHE", "") not in ("", "0"):
+        return None
+
+    cache_dir = os.environ.get("MANIM_CHEMISTRY_CACHE_DIR")
+    if cache_dir:
+        cache_dir = Path(cache_dir)
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(base_dir) / "manim_chemistry"
+
+    cache_dir = cache_dir.joinpath(*subdirectories)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+
+    return cache_dir
+
+
+def file_hash(filename) -> str:
+    """
+    Returns the sha256 hex digest of the contents of a file.
+    """
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def save_arrays(filename, **arrays) -> bool:
+    """
+    Saves arrays in a .npz file. The file is written next to its final
+    location and then moved, so readers never see a partial file.
+
+    Returns False if the file couldn't be written.
+    """
+    filename = Path(filename)
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=filename.parent, suffix=".tmp", delete=False
+        ) as file:
+            np.savez(file, **arrays)
+        os.replace(file.name, filename)
+    except OSError:
+        try:
+            os.unlink(file.name)
+        except (OSError, UnboundLocalError):
+            pass
+        return False
+
+    return True
+
+
+def load_arrays(filename) -> Dict[str, np.ndarray] or None:
+    """
+    Loads every array of a .npz file written by save_arrays.
+    Returns None if the file doesn't exist or can't be read.
+    """
+    try:
+        with np.load(filename, allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        return None
@@ -1,7 +1,7 @@
 import numpy as np
 from typing import List
 from manim import VGroup, Text
-from ..element import Element
+from ..element import Element, get_element_table
 from ..periodic_table import MElementWithPositions, MElementGroup, MElementObject
 from pathlib import Path
 
@@ -76,11 +76,10 @@ class PositionFinder:
 
 class AssignmentFinder:
     def __init__(self, elements_path):
-        available_atomic_numbers = list(range(1, 119))
-        available_elements = [Element.from_csv_file(elements_path, i)
-                              for i in available_atomic_numbers]
-        self.symbol_to_element = {element.symbol.lower(
-        ): element for element in available_elements}
+        self.symbol_to_element = {
+            element.symbol.lower(): element
+            for element in get_element_table(elements_path)
+        }
         self.memoised_assignments = {}
 
     def best_assignment_for_phrase(self, phrase):
@@ -1 +1,2 @@
 from .element import Element
+from .element_table import ElementTable, get_element_table, clear_element_tables
@@ -1,7 +1,11 @@
-import pandas as pd
+class Element:
+    """
+    Lightweight view of a row of an ElementTable. Elements created
+    directly get a table of their own with a single row.
+    """
 
+    __slots__ = ("_table", "_row")
 
-class Element:
     def __repr__(self) -> str:
         return f"Element {self.atomic_number}: {self.name} ({self.symbol})"
 
@@ -13,36 +17,59 @@ class Element:
         mass: float = 1.008,
         color: str or None = "#FFFFFF",
     ):
-        self.symbol = symbol
-        self.name = name
-        self.atomic_number = atomic_number
-        self.mass = mass
-        self.color = color or "#ff00ff"
+        from .element_table import ElementTable
 
-    def from_csv_file(filename, element: str or int):
-        use_valid_reference_string = f"What are you doing? Pass a valid atomic reference. {element} is NOT a valid reference"
-        data = pd.read_csv(filename, index_col=False)
+        self._table = ElementTable(
+            symbols=[symbol],
+            names=[name],
+            atomic_numbers=[atomic_number],
+            masses=[mass],
+            color_hexes=[color or "#ff00ff"],
+        )
+        self._row = 0
 
-        if isinstance(element, str):
-            search_column = "Symbol"
+    def view(table, row: int) -> "Element":
+        element = Element.__new__(Element)
+        element._table = table
+        element._row = row
 
-        elif isinstance(element, int) and element < 119:
-            search_column = "AtomicNumber"
+        return element
 
-        else:
-            raise Exception(use_valid_reference_string)
+    def __copy__(self):
+        return self
 
-        subdata = data.loc[data[search_column] == element]
+    def __deepcopy__(self, memo):
+        return self
 
-        if subdata.empty:
-            raise Exception(use_valid_reference_string)
+    @property
+    def symbol(self) -> str:
+        return self._table.symbol_list[self._row]
 
-        element_data = subdata.squeeze().to_dict()
+    @property
+    def name(self) -> str:
+        return self._table.name_list[self._row]
 
-        return Element(
-            symbol=element_data["Symbol"],
-            name=element_data["Name"],
-            atomic_number=element_data["AtomicNumber"],
-            mass=element_data["AtomicMass"],
-            color=element_data["Color"],
-        )
+    @property
+    def atomic_number(self) -> int:
+        return int(self._table.atomic_numbers[self._row])
+
+    @property
+    def mass(self) -> float:
+        return float(self._table.masses[self._row])
+
+    @property
+    def color(self) -> str:
+        return self._table.color_hexes[self._row]
+
+    @property
+    def covalent_radius(self) -> float:
+        return float(self._table.covalent_radii[self._row])
+
+    @property
+    def rgb(self):
+        return self._table.colors[self._row]
+
+    def from_csv_file(filename, element: str or int):
+        from .element_table import get_element_table
+
+        return get_element_table(filename).get(element)
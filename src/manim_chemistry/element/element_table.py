@@ -0,0 +1,354 @@
+import csv
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+
+from ..cache import get_cache_dir, file_hash, save_arrays, load_arrays
+from .element import Element
+
+# Increase when the layout of compiled element tables changes.
+COMPILED_TABLE_VERSION = 2
+
+# Covalent radii in angstroms by atomic number, from Cordero et al.,
+# "Covalent radii revisited", Dalton Trans. (2008). They are used when the
+# .csv database has no CovalentRadius column.
+COVALENT_RADII = [
+    0.20, 0.31, 0.28, 1.28, 0.96, 0.84, 0.76, 0.71, 0.66, 0.57, 0.58,
+    1.66, 1.41, 1.21, 1.11, 1.07, 1.05, 1.02, 1.06, 2.03, 1.76, 1.70,
+    1.60, 1.53, 1.39, 1.39, 1.32, 1.26, 1.24, 1.32, 1.22, 1.22, 1.20,
+    1.19, 1.20, 1.20, 1.16, 2.20, 1.95, 1.90, 1.75, 1.64, 1.54, 1.47,
+    1.46, 1.42, 1.39, 1.45, 1.44, 1.42, 1.39, 1.39, 1.38, 1.39, 1.40,
+    2.44, 2.15, 2.07, 2.04, 2.03, 2.01, 1.99, 1.98, 1.98, 1.96, 1.94,
+    1.92, 1.92, 1.89, 1.90, 1.87, 1.87, 1.75, 1.70, 1.62, 1.51, 1.44,
+    1.41, 1.36, 1.36, 1.32, 1.45, 1.46, 1.48, 1.40, 1.50, 1.50, 2.60,
+    2.21, 2.15, 2.06, 2.00, 1.96, 1.90, 1.87, 1.80, 1.69,
+]
+# Covalent radius of the elements missing in COVALENT_RADII
+DEFAULT_COVALENT_RADIUS = 1.50
+
+
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def hex_to_rgb(color: str) -> Tuple[float, float, float]:
+    color = color.lstrip("#")
+    return tuple(int(color[i : i + 2], 16) / 255 for i in (0, 2, 4))
+
+
+def color_to_rgb(color) -> Tuple[float, float, float]:
+    """
+    RGB values of a color given as "#RRGGBB", "#RGB" or anything manim
+    understands (named colors, manim color constants). manim is only
+    imported for the latter. Colors that can't be parsed get NaN values.
+    """
+    if isinstance(color, str) and color.startswith("#") and set(color[1:]) <= HEX_DIGITS:
+        if len(color) == 7:
+            return hex_to_rgb(color)
+        if len(color) == 4:
+            return hex_to_rgb("".join(digit * 2 for digit in color))
+
+    try:
+        from manim import color_to_rgb as manim_color_to_rgb
+
+        return tuple(float(value) for value in manim_color_to_rgb(color)[:3])
+    except Exception:
+        return (np.nan, np.nan, np.nan)
+
+
+class ElementTable:
+    """
+    Stores every element of a .csv database column by column:
+        - atomic_numbers: (N,) int array.
+        - masses: (N,) float array.
+        - colors: (N, 3) float array with RGB values between 0 and 1 (NaN
+          for colors that can't be parsed).
+        - covalent_radii: (N,) float array, in angstroms.
+        - symbols: (N,) str array of interned symbols.
+
+    Elements are looked up by symbol or by atomic number in O(1) and
+    whole arrays of them can be resolved at once with rows_for,
+    colors_for and masses_for.
+    """
+
+    def __repr__(self) -> str:
+        return f"ElementTable with {len(self)} elements"
+
+    def __init__(
+        self,
+        symbols,
+        names,
+        atomic_numbers,
+        masses,
+        color_hexes,
+        colors=None,
+        covalent_radii=None,
+    ):
+        self.symbol_list = [sys.intern(str(symbol)) for symbol in symbols]
+        self.name_list = [str(name) for name in names]
+        self.color_hexes = list(color_hexes)
+        self.symbols = np.array(self.symbol_list)
+        self.atomic_numbers = np.asarray(atomic_numbers, dtype=np.int32)
+        self.masses = np.asarray(masses, dtype=np.float64)
+        if colors is None:
+            colors = [color_to_rgb(color) for color in self.color_hexes]
+        self.colors = np.asarray(colors, dtype=np.float64).reshape(-1, 3)
+        self.covalent_radii = default_covalent_radii(self.atomic_numbers)
+        if covalent_radii is not None:
+            covalent_radii = np.asarray(covalent_radii, dtype=np.float64)
+            self.covalent_radii = np.where(
+                np.isnan(covalent_radii), self.covalent_radii, covalent_radii
+            )
+
+        self._symbol_rows: Dict[str, int] = {
+            symbol: row for row, symbol in enumerate(self.symbol_list)
+        }
+        self._symbol_sorter = np.argsort(self.symbols)
+        self._number_rows = np.full(
+            max(self.atomic_numbers.max(initial=0), 118) + 1, -1, dtype=np.int64
+        )
+        self._number_rows[self.atomic_numbers] = np.arange(len(self))
+        self._elements = [None] * len(self)
+
+    def __len__(self):
+        return len(self.symbol_list)
+
+    def __iter__(self):
+        return (self.element_at(row) for row in range(len(self)))
+
+    def element_at(self, row: int) -> Element:
+        element = self._elements[row]
+        if element is None:
+            element = self._elements[row] = Element.view(self, row)
+
+        return element
+
+    def row_of(self, element: str or int) -> int:
+        use_valid_reference_string = f"What are you doing? Pass a valid atomic reference. {element} is NOT a valid reference"
+
+        if isinstance(element, str):
+            row = self._symbol_rows.get(element, -1)
+
+        elif isinstance(element, int) and 0 <= element < 119:
+            row = self._number_rows[element]
+
+        else:
+            raise Exception(use_valid_reference_string)
+
+        if row < 0:
+            raise Exception(use_valid_reference_string)
+
+        return int(row)
+
+    def get(self, element: str or int) -> Element:
+        """
+        Returns the element with the given symbol or atomic number.
+        Raises an Exception if the reference is not in the table.
+        """
+        return self.element_at(self.row_of(element))
+
+    def rows_for(self, elements) -> np.ndarray:
+        """
+        Returns the table rows of an array of symbols or atomic numbers.
+        Raises an Exception if any of them is not in the table.
+        """
+        elements = np.asarray(elements)
+
+        if elements.dtype.kind in "iu":
+            in_range = (elements >= 0) & (elements < len(self._number_rows))
+            rows = np.full(elements.shape, -1, dtype=np.int64)
+            rows[in_range] = self._number_rows[elements[in_range]]
+
+        elif elements.dtype.kind in "UO":
+            elements = elements.astype(str)
+            positions = np.searchsorted(
+                self.symbols, elements, sorter=self._symbol_sorter
+            )
+            positions = np.minimum(positions, len(self) - 1)
+            rows = self._symbol_sorter[positions]
+            rows = np.where(self.symbols[rows] == elements, rows, -1)
+
+        else:
+            raise Exception(
+                f"What are you doing? {elements.dtype} is NOT a valid atomic reference type"
+            )
+
+        if rows.size and rows.min() < 0:
+            unknown = np.unique(elements[rows < 0])
+            raise Exception(
+                f"What are you doing? Pass valid atomic references. {', '.join(map(str, unknown))} are NOT valid references"
+            )
+
+        return rows
+
+    def colors_for(self, elements) -> np.ndarray:
+        return self.colors[self.rows_for(elements)]
+
+    def masses_for(self, elements) -> np.ndarray:
+        return self.masses[self.rows_for(elements)]
+
+    def covalent_radii_for(self, elements) -> np.ndarray:
+        return self.covalent_radii[self.rows_for(elements)]
+
+    def atomic_numbers_for(self, elements) -> np.ndarray:
+        return self.atomic_numbers[self.rows_for(elements)]
+
+    def molecular_mass(self, elements) -> float:
+        return float(self.masses_for(elements).sum())
+
+    def symbol_to_atomic_number(self) -> Dict[str, int]:
+        return {
+            symbol.lower(): int(atomic_number)
+            for symbol, atomic_number in zip(self.symbol_list, self.atomic_numbers)
+        }
+
+    def to_dataframe(self):
+        """
+        Returns the table as a pandas DataFrame with the same columns as
+        the .csv databases. pandas is only needed for this method.
+        """
+        try:
+            import pandas as pd
+        except ImportError as error:
+            raise ImportError(
+                "pandas is needed to export an ElementTable as a DataFrame. "
+                "Install it with: pip install manim-chemistry[dataframe]"
+            ) from error
+
+        return pd.DataFrame(
+            {
+                "AtomicNumber": self.atomic_numbers,
+                "Name": self.name_list,
+                "Symbol": self.symbol_list,
+                "AtomicMass": self.masses,
+                "Color": self.color_hexes,
+                "CovalentRadius": self.covalent_radii,
+            }
+        )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "symbols": self.symbols,
+            "names": np.array(self.name_list),
+            "atomic_numbers": self.atomic_numbers,
+            "masses": self.masses,
+            "color_hexes": np.array(self.color_hexes),
+            "colors": self.colors,
+            "covalent_radii": self.covalent_radii,
+        }
+
+    def from_arrays(arrays: Dict[str, np.ndarray]):
+        return ElementTable(
+            symbols=arrays["symbols"].tolist(),
+            names=arrays["names"].tolist(),
+            atomic_numbers=arrays["atomic_numbers"],
+            masses=arrays["masses"],
+            color_hexes=arrays["color_hexes"].tolist(),
+            colors=arrays["colors"],
+            covalent_radii=arrays["covalent_radii"],
+        )
+
+    def from_csv_file(filename):
+        """
+        Reads a .csv database. Its CovalentRadius column is optional;
+        missing values get the radius in COVALENT_RADII.
+        """
+        with open(filename, newline="", encoding="utf-8-sig") as file:
+            rows = list(csv.DictReader(file))
+
+        return ElementTable(
+            symbols=[row["Symbol"] for row in rows],
+            names=[row["Name"] for row in rows],
+            atomic_numbers=[int(row["AtomicNumber"]) for row in rows],
+            masses=[float(row["AtomicMass"]) for row in rows],
+            color_hexes=[row["Color"] or "#ff00ff" for row in rows],
+            covalent_radii=[
+                float(row.get("CovalentRadius") or "nan") for row in rows
+            ],
+        )
+
+
+def default_covalent_radii(atomic_numbers) -> np.ndarray:
+    radii = np.append(COVALENT_RADII, DEFAULT_COVALENT_RADIUS)
+    atomic_numbers = np.asarray(atomic_numbers)
+    known = (atomic_numbers >= 0) & (atomic_numbers < len(COVALENT_RADII))
+
+    return radii[np.where(known, atomic_numbers, len(COVALENT_RADII))]
+
+
+_element_tables: Dict[Tuple[str, float], ElementTable] = {}
+_element_tables_lock = threading.Lock()
+
+
+def compiled_table_path(filename) -> Path or None:
+    cache_dir = get_cache_dir("elements")
+    if cache_dir is None:
+        return None
+
+    path_hash = hashlib.sha256(str(filename).encode()).hexdigest()[:16]
+    return cache_dir / f"{Path(filename).stem}-{path_hash}.npz"
+
+
+def load_element_table(filename) -> ElementTable:
+    """
+    Loads the ElementTable of a .csv database from its compiled .npz
+    version, compiling it first if it doesn't exist yet or the .csv
+    file contents changed since it was compiled.
+    """
+    compiled_path = compiled_table_path(filename)
+    if compiled_path is None:
+        return ElementTable.from_csv_file(filename)
+
+    source_hash = file_hash(filename)
+    arrays = load_arrays(compiled_path)
+    if (
+        arrays is not None
+        and arrays.get("source_hash") == source_hash
+        and arrays.get("version") == COMPILED_TABLE_VERSION
+    ):
+        return ElementTable.from_arrays(arrays)
+
+    table = ElementTable.from_csv_file(filename)
+    save_arrays(
+        compiled_path,
+        source_hash=np.array(source_hash),
+        version=np.array(COMPILED_TABLE_VERSION),
+        **table.to_arrays(),
+    )
+
+    return table
+
+
+def get_element_table(filename) -> ElementTable:
+    """
+    Returns the ElementTable of a .csv database. Every file is loaded once
+    per process; the table is loaded again only if the file is modified.
+    """
+    path = os.path.abspath(filename)
+    key = (path, os.path.getmtime(path))
+
+    table = _element_tables.get(key)
+    if table is not None:
+        return table
+
+    with _element_tables_lock:
+        table = _element_tables.get(key)
+        if table is None:
+            table = load_element_table(path)
+            for stale_key in [k for k in _element_tables if k[0] == path]:
+                del _element_tables[stale_key]
+            _element_tables[key] = table
+
+    return table
+
+
+def clear_element_tables():
+    """
+    Forgets every loaded ElementTable.
+    """
+    with _element_tables_lock:
+        _element_tables.clear()
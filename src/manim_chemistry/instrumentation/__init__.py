@@ -0,0 +1 @@
+from .instrumentation import BuildProfile, profile_build, profiled_stage, is_profiling
@@ -0,0 +1,157 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from importlib import import_module
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Classes whose instances are counted while a build is profiled, with the
+# module that defines them. They are imported only when profiling starts.
+COUNTED_CLASSES = {
+    "MarkupText": "manim",
+    "Text": "manim",
+    "Tex": "manim",
+    "Line": "manim",
+    "Polygram": "manim",
+    "OpenGLSurface": "manim.mobject.opengl.opengl_surface",
+}
+
+_active_profiles: List["BuildProfile"] = []
+_active_profiles_lock = threading.Lock()
+_original_inits = {}
+
+
+class BuildProfile:
+    """
+    Results of a profiled build:
+        - stages: wall time in seconds and number of calls of every stage.
+        - counters: number of objects created of every counted class.
+    """
+
+    def __repr__(self) -> str:
+        return f"BuildProfile({self.as_dict()})"
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+
+    def add_stage_time(self, name: str, elapsed: float):
+        stage = self.stages.setdefault(name, {"time": 0.0, "calls": 0})
+        stage["time"] += elapsed
+        stage["calls"] += 1
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_dict(self) -> dict:
+        return {
+            "stages": {name: dict(stage) for name, stage in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+
+def _counting_init(cls, name, original_init):
+    def __init__(self, *args, **kwargs):
+        # Subclasses call this __init__ through super() too, but only
+        # objects of the class itself are counted.
+        if type(self) is cls:
+            for profile in _active_profiles:
+                profile.count(name)
+        original_init(self, *args, **kwargs)
+
+    return __init__
+
+
+def _install_counters():
+    for name, module_name in COUNTED_CLASSES.items():
+        try:
+            cls = getattr(import_module(module_name), name)
+        except (ImportError, AttributeError):
+            continue
+        _original_inits[cls] = cls.__dict__.get("__init__")
+        cls.__init__ = _counting_init(cls, name, cls.__init__)
+
+
+def _uninstall_counters():
+    for cls, original_init in _original_inits.items():
+        if original_init is None:
+            del cls.__init__
+        else:
+            cls.__init__ = original_init
+    _original_inits.clear()
+
+
+def is_profiling() -> bool:
+    return bool(_active_profiles)
+
+
+@contextmanager
+def profile_build():
+    """
+    Profiles every manim_chemistry build inside the with block:
+
+        with profile_build() as profile:
+            molecule = MMoleculeObject.from_mol_file("morphine.mol")
+
+        profile.as_dict()
+
+    Profiles can be nested; every active profile records everything.
+    Profiles are not isolated between threads: a profile also records the
+    builds of any other thread running while it is active.
+    """
+    profile = BuildProfile()
+    with _active_profiles_lock:
+        if not _active_profiles:
+            _install_counters()
+        _active_profiles.append(profile)
+
+    try:
+        yield profile
+    finally:
+        with _active_profiles_lock:
+            _active_profiles.remove(profile)
+            if not _active_profiles:
+                _uninstall_counters()
+
+
+def _profiling_from_environment() -> bool:
+    return os.environ.get("MANIM_CHEMISTRY_PROFILE", "") not in ("", "0")
+
+
+def _log_profile(name: str, profile: BuildProfile):
+    """
+    Logs the profile as JSON at INFO level through the module logger. The
+    logging configuration is left to the application.
+    """
+    logger.info(json.dumps({"build": name, **profile.as_dict()}))
+
+
+@contextmanager
+def profiled_stage(name: str):
+    """
+    Records the wall time of a build stage in every active profile.
+    Does nothing if no profile is active, unless the environment variable
+    MANIM_CHEMISTRY_PROFILE is set: then the outermost stage profiles
+    itself and logs the results as JSON.
+    """
+    if not _active_profiles:
+        if _profiling_from_environment():
+            with profile_build() as profile:
+                with profiled_stage(name):
+                    yield
+            _log_profile(name, profile)
+        else:
+            yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        for profile in _active_profiles:
+            profile.add_stage_time(name, elapsed)
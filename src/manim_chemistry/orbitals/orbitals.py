@@ -11,6 +11,8 @@ from manim import (
 
 from manim.mobject.opengl.opengl_surface import OpenGLSurface
 
+from ..instrumentation import profiled_stage
+
 
 class OrbitalBase(OpenGLSurface):
     """
@@ -95,22 +97,25 @@ class Orbital(OpenGLSurface):
     an orbital. n value is still not implemented TODO
     """
     def __init__(self, n=None, l=0, m=0, size=3, **kwargs):
-        super().__init__(self.uv_func, **kwargs)
-        if not n:
-            self.n = l + 1
-        else:
-            self.n = n
-        self.l = l
-        self.m = m
-        self.size = size
-        pos = OrbitalPositive(
-            n_value=self.n, l_value=self.l, m_value=self.m, size=self.size
-        ).set_color(RED)
-        neg = OrbitalNegative(
-            n_value=self.n, l_value=self.l, m_value=self.m, size=self.size
-        ).set_color(BLUE)
-        self.add(pos, neg)
-        self.needs_new_bounding_box = True
+        with profiled_stage("Orbital"):
+            super().__init__(self.uv_func, **kwargs)
+            if not n:
+                self.n = l + 1
+            else:
+                self.n = n
+            self.l = l
+            self.m = m
+            self.size = size
+            with profiled_stage("Orbital.positive"):
+                pos = OrbitalPositive(
+                    n_value=self.n, l_value=self.l, m_value=self.m, size=self.size
+                ).set_color(RED)
+            with profiled_stage("Orbital.negative"):
+                neg = OrbitalNegative(
+                    n_value=self.n, l_value=self.l, m_value=self.m, size=self.size
+                ).set_color(BLUE)
+            self.add(pos, neg)
+            self.needs_new_bounding_box = True
 
     def uv_func(self, u, v):
         return np.array([0, 0, 0])
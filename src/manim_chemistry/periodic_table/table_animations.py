@@ -1,5 +1,5 @@
 from manim import *
-from ..element import Element
+from ..element import Element, get_element_table
 from .table_objects import MElementObject
 
 from pathlib import Path
@@ -52,11 +52,10 @@ class PositionFinder:
 
 class AssignmentFinder:
     def __init__(self, csv_path):
-        available_atomic_numbers = list(range(1, 119))
-        available_elements = [Element.from_csv_file(csv_path / "Elementos.csv", i)
-                              for i in available_atomic_numbers]
-        self.symbol_to_element = {element.symbol.lower(
-        ): element for element in available_elements}
+        self.symbol_to_element = {
+            element.symbol.lower(): element
+            for element in get_element_table(csv_path / "Elementos.csv")
+        }
         self.memoised_assignments = {}
 
     def best_assignment_for_phrase(self, phrase):
@@ -16,12 +16,12 @@ from manim import (
     ORIGIN,
     DOWN,
 )
-import pandas as pd
 import numpy as np
 from pathlib import Path
 
-from ..element import Element
+from ..element import get_element_table
 from ..utils import get_symbol_to_atomic_number
+from ..instrumentation import profiled_stage
 
 current_file_path = Path(__file__).absolute().parent
 elements_path = current_file_path.parent.parent.parent / "assets/Elements_EN.csv"
@@ -125,16 +125,14 @@ class MElementObject(VGroup):
     def from_csv_file_data(filename, atomic_number, **kwargs):
         # TODO: Add option to set manually colors.
         # TODO: Create a table that adds this data in a prettier way.
-        df = pd.read_csv(filename)
-        element = df.loc[df["AtomicNumber"] ==
-                         atomic_number].squeeze().to_dict()
+        element = get_element_table(filename).get(atomic_number)
 
         return MElementObject(
             atomic_number=atomic_number,
-            atomic_mass=element.get("AtomicMass"),
-            element_name=element.get("Name"),
-            element_symbol=element.get("Symbol"),
-            fill_colors=[element.get("Color"), WHITE],
+            atomic_mass=element.mass,
+            element_name=element.name,
+            element_symbol=element.symbol,
+            fill_colors=[element.color, WHITE],
         )
 
 
@@ -318,9 +316,12 @@ class MElementGroup(VGroup):
 
 class PeriodicTable(MElementGroup):
     def __init__(self, data_file_path, *vmobjects, **kwargs):
-        self.data_file_path = data_file_path
-        els = self.get_els()
-        MElementGroup.__init__(self, els, *vmobjects, **kwargs)
+        with profiled_stage("PeriodicTable"):
+            self.data_file_path = data_file_path
+            with profiled_stage("PeriodicTable.get_els"):
+                els = self.get_els()
+            with profiled_stage("PeriodicTable.group_elements"):
+                MElementGroup.__init__(self, els, *vmobjects, **kwargs)
 
     def get_els(self):
         positions = self.elements_position_dict()
@@ -330,28 +330,42 @@ class ThreeDBond(OpenGLGroup):
     def __init__(self, from_atom, to_atom, bond_type, *mobjects, **kwargs):
         self.from_atom = from_atom
         self.to_atom = to_atom
+        self.bond_type = bond_type
         super().__init__(**kwargs)
         self.add(*mobjects)
-        if bond_type in [
+        self.bonds = self.create_bonds()
+        self.add(self.bonds)
+
+    def create_bonds(self):
+        if self.bond_type in [
             1,
         ]:
-            self.bonds = self.add_single_bond()
+            return self.add_single_bond()
 
-        elif bond_type in [2, 5, 7]:
-            self.bonds = self.add_double_bond()
+        elif self.bond_type in [2, 5, 7]:
+            return self.add_double_bond()
 
-        elif bond_type in [
+        elif self.bond_type in [
             3,
         ]:
-            self.bonds = self.add_triple_bond()
+            return self.add_triple_bond()
 
         else:
             raise Exception(
                 f"Unknown or unsupported bond type at bond with from atom {self.from_atom} with index {self.from_atom.index}and to atom {self.to_atom} with index {self.from_atom.index}"
             )
 
+    def update_bonds(self, shift=ORIGIN):
+        """
+        Creates the bonds again from the coordinates of the atoms, for
+        example after they move, and moves them by shift.
+        """
+        self.remove(self.bonds)
+        self.bonds = self.create_bonds().shift(shift)
         self.add(self.bonds)
 
+        return self
+
     def add_single_bond(self):
         bond = OpenGLGroup()
         midpoint = (self.to_atom.coords + self.from_atom.coords) / 2
@@ -1,10 +1,20 @@
+import numpy as np
 from manim import (
     ORIGIN,
 )
 from manim.mobject.opengl.opengl_mobject import OpenGLGroup
+from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
 
-from ..element import Element
-from ..utils import mol_parser
+from ..element import get_element_table
+from ..utils import (
+    cached_mol_array_parser,
+    pdb_parser,
+    mmcif_parser,
+    xyz_parser,
+    perceive_bonds,
+)
+from ..utils.frame_tracker import frame_tracker_points, frame_transform
+from ..instrumentation import profiled_stage
 
 from .threedatom import ThreeDAtom
 from .threedbond import ThreeDBond
@@ -25,25 +35,37 @@ class ThreeDMolecule(OpenGLGroup):
         *mobjects,
         **kwargs,
     ):
-        self.atoms_dict = atoms_dict
-        self.bonds_dict = bonds_dict
-        self.source_csv = source_csv
-        self.atoms = self.get_atoms_from_csv()
-        self.bonds = self.get_bonds()
-        super().__init__(**kwargs)
-        self.add(*mobjects)
-        if add_bonds:
-            self.add(self.bonds)
-        if add_atoms:
-            self.add(self.atoms)
-        self.move_to(ORIGIN)
+        with profiled_stage("ThreeDMolecule"):
+            self.atoms_dict = atoms_dict
+            self.bonds_dict = bonds_dict
+            self.source_csv = source_csv
+            with profiled_stage("ThreeDMolecule.get_atoms_from_csv"):
+                self.atoms = self.get_atoms_from_csv()
+            with profiled_stage("ThreeDMolecule.get_bonds"):
+                self.bonds, self.bonds_by_atom = self.get_bonds()
+            super().__init__(**kwargs)
+            self.add(*mobjects)
+            if add_bonds:
+                self.add(self.bonds)
+            if add_atoms:
+                self.add(self.atoms)
+            with profiled_stage("ThreeDMolecule.move_to_origin"):
+                self.coords_shift = ORIGIN - self.get_center()
+                self.shift(self.coords_shift)
+                if not add_bonds:
+                    self.bonds.shift(self.coords_shift)
+                if not add_atoms:
+                    self.atoms.shift(self.coords_shift)
+            self.frame_tracker = OpenGLVMobject(
+                stroke_width=0, stroke_opacity=0, fill_opacity=0
+            ).set_points(frame_tracker_points())
+            self.add(self.frame_tracker)
 
     def get_atoms_from_csv(self):
         atoms = OpenGLGroup()
+        element_table = get_element_table(self.source_csv)
         for _, atom in self.atoms_dict.items():
-            element = Element.from_csv_file(
-                self.source_csv, atom.get("element")
-            )  # TODO: Make the file an option
+            element = element_table.get(atom.get("element"))
             atoms.add(ThreeDAtom(element, atom.get("coords")))
             
 
@@ -51,19 +73,102 @@ class ThreeDMolecule(OpenGLGroup):
 
     def get_bonds(self):
         bonds = OpenGLGroup()
+        bonds_by_atom = {}
         for index, bonds_list in self.bonds_dict.items():
             from_atom = self.atoms[index - 1]
             for bond in bonds_list:
                 to_atom = self.atoms[bond.get("to") - 1]
                 bond_type = bond.get("type")
-                bonds.add(
-                    ThreeDBond(
-                        from_atom=from_atom, to_atom=to_atom, bond_type=int(bond_type)
-                    )
+                new_bond = ThreeDBond(
+                    from_atom=from_atom, to_atom=to_atom, bond_type=int(bond_type)
                 )
+                bonds.add(new_bond)
+                bonds_by_atom.setdefault(index, []).append(new_bond)
+                bonds_by_atom.setdefault(bond.get("to"), []).append(new_bond)
+
+        return bonds, bonds_by_atom
+
+    def get_frame_transform(self):
+        """
+        Returns the matrix and the origin that take a point of the frame of
+        the centered molecule (coordinates plus coords_shift) to where it is
+        now, after every transformation the molecule got.
+        """
+        return frame_transform(self.frame_tracker.points)
+
+    def update_coordinates(self, new_coords):
+        """
+        Moves the atoms to new_coords, an (N, 3) array with the coordinates
+        of every atom in the order of atoms_dict, in the frame of the
+        coordinates the molecule was created from. They get the same
+        centering and transformations (shift, scale, rotate, next_to...)
+        the molecule got after being created.
+
+        Only the bonds of the atoms that moved are created again, so it can
+        be called from updaters of big molecules.
+        """
+        new_coords = np.array(new_coords, dtype=np.float64).reshape(-1, 3)
+        old_coords = np.array([atom.coords for atom in self.atoms], dtype=np.float64)
+        matrix, origin = self.get_frame_transform()
+
+        moved_bonds = {}
+        for position in np.flatnonzero((old_coords != new_coords).any(axis=1)).tolist():
+            atom = self.atoms[position]
+            atom.shift(matrix @ (new_coords[position] - old_coords[position]))
+            atom.coords = new_coords[position]
+            for bond in self.bonds_by_atom.get(position + 1, []):
+                moved_bonds[id(bond)] = bond
 
-        return bonds
+        for bond in moved_bonds.values():
+            bond.update_bonds(self.coords_shift)
+            bond.bonds.apply_matrix(matrix).shift(origin)
+
+        return self
 
     def from_mol_file(filename, source_csv):
-        atoms, bonds = mol_parser(file=filename)
-        return ThreeDMolecule(atoms_dict=atoms, bonds_dict=bonds, source_csv=source_csv)
+        with profiled_stage("ThreeDMolecule.from_mol_file"):
+            molecule = cached_mol_array_parser(filename)
+            return ThreeDMolecule.from_molecule_arrays(molecule, source_csv)
+
+    def from_molecule_arrays(molecule, source_csv, **kwargs):
+        return ThreeDMolecule(
+            atoms_dict=molecule.atoms_dict,
+            bonds_dict=molecule.bonds_dict,
+            source_csv=source_csv,
+            **kwargs,
+        )
+
+    def from_pdb_file(filename, source_csv, bond_perception=True, **selection):
+        """
+        Creates a ThreeDMolecule from a .pdb file. selection takes the
+        chains, residues, altloc, model and hetero_atoms options of
+        pdb_parser, to only draw part of big structures.
+
+        .pdb files rarely have every bond, so with bond_perception the
+        missing ones are found from the distances between atoms.
+        """
+        with profiled_stage("ThreeDMolecule.from_pdb_file"):
+            molecule = pdb_parser(filename, **selection)
+            if bond_perception:
+                molecule = perceive_bonds(molecule, source_csv)
+            return ThreeDMolecule.from_molecule_arrays(molecule, source_csv)
+
+    def from_mmcif_file(filename, source_csv, bond_perception=True, **selection):
+        """
+        Creates a ThreeDMolecule from an mmCIF file. It takes the same
+        options as from_pdb_file.
+        """
+        with profiled_stage("ThreeDMolecule.from_mmcif_file"):
+            molecule = mmcif_parser(filename, **selection)
+            if bond_perception:
+                molecule = perceive_bonds(molecule, source_csv)
+            return ThreeDMolecule.from_molecule_arrays(molecule, source_csv)
+
+    def from_xyz_file(filename, source_csv):
+        """
+        Creates a ThreeDMolecule from an .xyz file. Its bonds are found
+        from the distances between atoms.
+        """
+        with profiled_stage("ThreeDMolecule.from_xyz_file"):
+            molecule = perceive_bonds(xyz_parser(filename), source_csv)
+            return ThreeDMolecule.from_molecule_arrays(molecule, source_csv)
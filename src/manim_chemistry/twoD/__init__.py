@@ -1,3 +1,4 @@
 from .atom import MAtomObject
+from .labels import get_label, get_number_label, clear_labels
 from .bond import BaseMBondObject, SimpleBond, DoubleBond, TripleBond
-from .molecule import MMoleculeObject, NamedMolecule
+from .molecule import MMoleculeObject, NamedMolecule, clear_molecule_prototypes
@@ -1,6 +1,7 @@
-from manim import VGroup, WHITE, MarkupText, RIGHT, LEFT
+from manim import VGroup, WHITE, RIGHT, LEFT
 import numpy as np
 from typing import Dict, Any
+from .labels import get_label
 
 
 class MAtomObject(VGroup):
@@ -78,7 +79,7 @@ class MAtomObject(VGroup):
         Adds an atom depending on the representation
         """
         if self.representation != "skeleton":
-            return MarkupText(self.element).scale(0.8)
+            return get_label(self.element, scale=0.8)
 
     def bonds_fulfilled(self):
         minimum_bonds = {"O": 2, "S": 2, "N": 3, "P": 3}
@@ -1,9 +1,19 @@
-from manim import VGroup, WHITE, Line, Polygram, PI, VMobject
+from manim import VGroup, WHITE, Line, Polygram, PI, VMobject, ORIGIN
 import numpy as np
 from typing import Dict, Any
 from .atom import MAtomObject
 
 
+# Subtype of a bond by the representations of its from and to atoms. Other
+# pairs have no subtype, so their line touches the center of both atoms.
+BOND_SUBTYPES = {
+    ("complete", "complete"): "shorter",
+    ("complete", "skeleton"): "shorter_from",
+    ("complete", "over_bond"): "shorter_from",
+    ("skeleton", "complete"): "shorter_to",
+}
+
+
 class BaseMBondObject(VGroup):
     def __str__(self):
         return f"MBondObject bonding {self.from_atom} with {self.to_atom}"
@@ -29,6 +39,7 @@ class BaseMBondObject(VGroup):
         self.subtype = self.define_subtype(subtype) or subtype
         self.bond = self.create_line()
         self.index = index
+        self.flipped = False
         self.add(self.bond)
 
     def define_subtype(self, subtype: str) -> str or bool:
@@ -44,21 +55,52 @@ class BaseMBondObject(VGroup):
             - shorter_to: Does not touch the center of the to atom.
             - None or false: Touches both atoms center
         """
-        from_representation = self.from_atom.representation
-        to_representation = self.to_atom.representation
-        if from_representation == "complete":
-            if to_representation == "complete":
-                return "shorter"
-            elif to_representation == "skeleton" or to_representation == "over_bond":
-                return "shorter_from"
-
-        if from_representation == "skeleton" or to_representation == "over_bond":
-            if to_representation == "complete":
-                return "shorter_to"
-            elif to_representation == "skeleton" or to_representation == "over_bond":
-                return False
-
-        return False
+        return BaseMBondObject.subtype_for(
+            self.from_atom.representation, self.to_atom.representation
+        )
+
+    def subtype_for(from_representation: str, to_representation: str) -> str or bool:
+        """
+        Subtype of a bond between atoms with these representations, from
+        BOND_SUBTYPES. Doesn't need any bond, so the subtypes of a whole
+        molecule can be known before creating it.
+        """
+        return BOND_SUBTYPES.get((from_representation, to_representation), False)
+
+    def create_subtype(self, subtypes):
+        """
+        Creates the line of the bond's subtype only. subtypes maps every
+        subtype to a function that creates its line.
+        """
+        create_line = subtypes.get(self.subtype)
+
+        return (create_line and create_line()) or VMobject()
+
+    def update_line(self, shift=ORIGIN):
+        """
+        Creates the line again from the coordinates of the atoms, for
+        example after they move, and moves it by shift. Flipped bonds stay
+        flipped.
+        """
+        self.remove(self.bond)
+        self.bond = self.create_line().shift(shift)
+        self.add(self.bond)
+        if self.flipped:
+            self.flipped = False
+            self.flip()
+
+        return self
+
+    def flip(self):
+        """
+        Rotates the bond half a turn around its first line, which moves the
+        other lines of double bonds to its other side.
+        """
+        line = self[0][0]
+        self.rotate(PI, about_point=line.get_center(), axis=line.end - line.start)
+        self.flipped = not self.flipped
+
+        return self
 
     def atoms_in_bond(self):
         return self.from_atom, self.to_atom
@@ -154,13 +196,13 @@ class SimpleBond(BaseMBondObject):
 
         else:
             subtypes = {
-                "shorter": self.shorter_subtype(),
-                "shorter_from": self.shorter_from_subtype(direction),
-                "shorter_to": self.shorter_to_subtype(direction),
-                "longer": self.longer_subtype(),
+                "shorter": self.shorter_subtype,
+                "shorter_from": lambda: self.shorter_from_subtype(direction),
+                "shorter_to": lambda: self.shorter_to_subtype(direction),
+                "longer": self.longer_subtype,
             }
 
-            return subtypes.get(self.subtype) or VMobject()
+            return self.create_subtype(subtypes)
 
 
 class DoubleBond(BaseMBondObject):
@@ -172,6 +214,14 @@ class DoubleBond(BaseMBondObject):
         self.double_bond_scale = double_bond_scale
         super().__init__(from_atom, to_atom, **kwargs)
 
+    def side_sign(self, default: int) -> int:
+        """
+        Sign of the perpendicular vector towards the side where the second
+        line goes: the side of the bond ring if the bond is in one,
+        default otherwise.
+        """
+        return np.sign(self.side) if self.side else default
+
     def no_subtype(self):
         unit_vector = (
             self.get_perpendicular_unit_vector(
@@ -181,7 +231,7 @@ class DoubleBond(BaseMBondObject):
         )  # TODO: Make this product value an option
         long_line = Line(self.from_atom.coords, self.to_atom.coords)
         short_line = Line(self.from_atom.coords, self.to_atom.coords, buff=0.15).shift(
-            -unit_vector
+            self.side_sign(-1) * unit_vector
         )  # TODO: Make the buff an option
 
         return VGroup(long_line, short_line)
@@ -223,7 +273,9 @@ class DoubleBond(BaseMBondObject):
                 self.to_atom.coords, self.from_atom.coords - 0.25 * direction
             )
             double_line = (
-                base_line.copy().scale(self.double_bond_scale).shift(1.5 * unit_vector)
+                base_line.copy()
+                .scale(self.double_bond_scale)
+                .shift(1.5 * self.side_sign(1) * unit_vector)
             )  # TODO: Make this scale an option
 
         return VGroup(base_line, double_line)
@@ -247,7 +299,9 @@ class DoubleBond(BaseMBondObject):
                 self.from_atom.coords, self.to_atom.coords + 0.25 * direction
             )
             double_line = (
-                base_line.copy().scale(self.double_bond_scale).shift(1.5 * unit_vector)
+                base_line.copy()
+                .scale(self.double_bond_scale)
+                .shift(1.5 * self.side_sign(1) * unit_vector)
             )  # TODO: Make this scale an option
 
         return VGroup(base_line, double_line)
@@ -281,7 +335,6 @@ class DoubleBond(BaseMBondObject):
         return from_surroundings, to_surroundings
 
     def create_line(self):
-        from_surroundings, to_surroundings = self.get_surroundings()
         direction = self.from_atom.coords - self.to_atom.coords
 
         if not self.subtype:
@@ -289,20 +342,16 @@ class DoubleBond(BaseMBondObject):
 
         else:
             subtypes = {
-                "shorter": self.shorter_subtype(),
-                "shorter_from": self.shorter_from_subtype(
-                    direction=direction,
-                    from_surroundings=from_surroundings,
-                    to_surroundings=to_surroundings,
+                "shorter": self.shorter_subtype,
+                "shorter_from": lambda: self.shorter_from_subtype(
+                    direction, *self.get_surroundings()
                 ),
-                "shorter_to": self.shorter_to_subtype(
-                    direction,
-                    from_surroundings=from_surroundings,
-                    to_surroundings=to_surroundings,
+                "shorter_to": lambda: self.shorter_to_subtype(
+                    direction, *self.get_surroundings()
                 ),
             }
 
-            return subtypes.get(self.subtype) or VMobject()
+            return self.create_subtype(subtypes)
 
 
 class TripleBond(BaseMBondObject):
@@ -392,12 +441,12 @@ class TripleBond(BaseMBondObject):
 
         else:
             subtypes = {
-                "shorter": self.shorter_subtype(),
-                "shorter_from": self.shorter_from_subtype(direction=direction),
-                "shorter_to": self.shorter_to_subtype(direction=direction),
+                "shorter": self.shorter_subtype,
+                "shorter_from": lambda: self.shorter_from_subtype(direction),
+                "shorter_to": lambda: self.shorter_to_subtype(direction),
             }
 
-            return subtypes.get(self.subtype) or VMobject()
+            return self.create_subtype(subtypes)
 
 
 class PlainCramBond(BaseMBondObject):
@@ -476,12 +525,13 @@ class PlainCramBond(BaseMBondObject):
 
         else:
             subtypes = {
-                "shorter": self.shorter_subtype(),
-                "shorter_from": self.shorter_from_subtype(),
-                "shorter_to": self.shorter_to_subtype(),
-                "longer": self.longer_subtype(),
+                "shorter": self.shorter_subtype,
+                "shorter_from": self.shorter_from_subtype,
+                "shorter_to": self.shorter_to_subtype,
+                "longer": self.longer_subtype,
             }
-            return subtypes.get(self.subtype) or VMobject()
+
+            return self.create_subtype(subtypes)
 
 
 class DashedCramBond(BaseMBondObject):
@@ -541,10 +591,21 @@ class DashedCramBond(BaseMBondObject):
 
         else:
             subtypes = {
-                "shorter": self.shorter_subtype(),
-                "shorter_from": self.shorter_from_subtype(),
-                "shorter_to": self.shorter_to_subtype(),
-                "longer": self.longer_subtype(),
+                "shorter": self.shorter_subtype,
+                "shorter_from": self.shorter_from_subtype,
+                "shorter_to": self.shorter_to_subtype,
+                "longer": self.longer_subtype,
             }
 
-            return subtypes.get(self.subtype) or VMobject()
+            return self.create_subtype(subtypes)
+
+
+# Kinds of bonds given by MMoleculeObject.classify_bonds, and the class used
+# to draw each of them. Hidden bonds are not drawn.
+HIDDEN_BOND = 0
+SIMPLE_BOND = 1
+DOUBLE_BOND = 2
+TRIPLE_BOND = 3
+PLAIN_CRAM_BOND = 4
+DASHED_CRAM_BOND = 5
+BOND_CLASSES = (None, SimpleBond, DoubleBond, TripleBond, PlainCramBond, DashedCramBond)
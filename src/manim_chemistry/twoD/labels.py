@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from manim import MarkupText, VMobject, NORMAL
+
+DIGITS = "0123456789"
+
+# Most labels kept by get_label. The least recently used ones are removed
+# when there are more.
+LABEL_CACHE_SIZE = 512
+
+_labels = OrderedDict()
+_labels_lock = threading.Lock()
+_digit_glyphs = {}
+
+
+def get_label(
+    text: str, font: str = "", weight: str = NORMAL, scale: float = 1
+) -> MarkupText:
+    """
+    Returns a MarkupText of text scaled by scale. Every label is laid out
+    once per process and kept, so later calls only copy its points.
+    """
+    key = (text, font, weight, scale)
+    with _labels_lock:
+        label = _labels.get(key)
+        if label is not None:
+            _labels.move_to_end(key)
+
+    if label is None:
+        label = MarkupText(text, font=font, weight=weight).scale(scale)
+        with _labels_lock:
+            _labels[key] = label
+            while len(_labels) > LABEL_CACHE_SIZE:
+                _labels.popitem(last=False)
+
+    return label.copy()
+
+
+def clear_labels():
+    """
+    Forgets every label kept by get_label.
+    """
+    with _labels_lock:
+        _labels.clear()
+        _digit_glyphs.clear()
+
+
+def get_digit_glyphs(font: str = "", weight: str = NORMAL):
+    """
+    Returns the glyphs of the digits, laid out once per font and weight:
+        - The points of every digit, starting at x = 0 and on a common
+          baseline.
+        - The width of every digit.
+        - The space between two digits.
+        - A glyph to take the style of numbers from.
+    """
+    key = (font, weight)
+    glyphs = _digit_glyphs.get(key)
+    if glyphs is None:
+        digits = get_label(DIGITS, font=font, weight=weight)
+        lefts = np.array([glyph.get_left()[0] for glyph in digits])
+        rights = np.array([glyph.get_right()[0] for glyph in digits])
+        points = {
+            digit: glyph.points - np.array([left, 0, 0])
+            for digit, glyph, left in zip(DIGITS, digits, lefts)
+        }
+        widths = dict(zip(DIGITS, rights - lefts))
+        spacing = float(np.mean(lefts[1:] - rights[:-1]))
+        glyphs = (points, widths, spacing, digits[0])
+        with _labels_lock:
+            _digit_glyphs[key] = glyphs
+
+    return glyphs
+
+
+def get_number_label(
+    number: int, font: str = "", weight: str = NORMAL, scale: float = 1
+) -> VMobject:
+    """
+    Returns number as a single VMobject made of copies of the points of
+    its digits, so numbering thousands of atoms only lays out ten glyphs.
+    """
+    points, widths, spacing, style = get_digit_glyphs(font, weight)
+    number_points = []
+    x = 0
+    for digit in str(number):
+        number_points.append(points[digit] + np.array([x, 0, 0]))
+        x += widths[digit] + spacing
+
+    label = VMobject()
+    label.set_points(np.concatenate(number_points))
+    label.match_style(style)
+
+    return label.scale(scale)
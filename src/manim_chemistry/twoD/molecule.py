@@ -1,8 +1,64 @@
-from manim import VGroup, VDict, MarkupText, MathTex, SVGMobject, RIGHT, DOWN, RED, GREEN, ORIGIN
+from manim import VGroup, VDict, VMobject, MarkupText, MathTex, SVGMobject, RIGHT, DOWN, RED, GREEN, ORIGIN, config
 from typing import Dict, Any
+from collections import OrderedDict
+import threading
+import numpy as np
 from .atom import MAtomObject
 from .bond import *
-from ..utils import mol_parser
+from .labels import get_number_label
+from ..utils import cached_mol_array_parser, find_rings
+from ..utils.frame_tracker import frame_tracker_points, frame_transform
+from ..cache import file_hash
+from ..instrumentation import profiled_stage
+
+# Levels of detail of MMoleculeObject:
+#   - FULL_DETAIL: everything is drawn.
+#   - SIMPLE_BONDS: double, triple and dashed cram bonds are drawn as simple
+#     bonds.
+#   - NO_LABELS: simple bonds and no atom labels.
+FULL_DETAIL = 0
+SIMPLE_BONDS = 1
+NO_LABELS = 2
+# Accepted values of level_of_detail. "auto" chooses one of the levels
+# from the size of the molecule.
+LEVELS_OF_DETAIL = ("auto", FULL_DETAIL, SIMPLE_BONDS, NO_LABELS)
+# Number of atoms over which molecules get each level past FULL_DETAIL,
+# when their scale on screen is not known.
+LEVEL_OF_DETAIL_ATOMS = (2000, 10000)
+# Approximate height of atom labels and space between the lines of double
+# bonds, and the pixels they need to be seen.
+LABEL_HEIGHT = 0.3
+MIN_LABEL_PIXELS = 5
+DOUBLE_BOND_GAP = 0.2
+MIN_BOND_GAP_PIXELS = 4
+# Most molecules kept by from_mol_file to be copied. The least recently
+# used ones are removed when there are more.
+MOLECULE_PROTOTYPES = 16
+
+_prototypes = OrderedDict()
+_prototypes_lock = threading.Lock()
+
+
+def _frozen(value):
+    """
+    Hashable version of the arguments of a molecule.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _frozen(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return (value.shape, value.tobytes())
+
+    return value
+
+
+def clear_molecule_prototypes():
+    """
+    Forgets every molecule kept by MMoleculeObject.from_mol_file.
+    """
+    with _prototypes_lock:
+        _prototypes.clear()
 
 
 class MMoleculeObject(VGroup):
@@ -17,36 +73,96 @@ class MMoleculeObject(VGroup):
         add_atoms_numbering: bool = False,
         add_bonds_numbering: bool = False,
         rotate_bonds: list = [],
+        merge_bonds: bool = False,
+        level_of_detail: int or str = FULL_DETAIL,
+        target_scale: float = None,
         **kwargs,
     ):
-        VGroup.__init__(self, **kwargs)
-        self.atoms_dict = atoms_dict
-        self.bonds_dict = bonds_dict
-        self.representation_type = representation_type
-        self.explicit_carbons = explicit_carbons
-        self.explicit_hydrogens = explicit_hydrogens
-        self.planar = planar
-        self.atoms, self.atoms_by_index = self.get_atoms()
-        self.bonds = self.get_bonds()
-        self.add(self.atoms, self.bonds)
-        if add_atoms_numbering:
-            self.add_atom_numbering()
-        if add_bonds_numbering:
-            self.add_bond_numbering()
-        self.rotate_bond(rotate_bonds)
-        self.complete_missing_hydrogens()
-        self.move_to(ORIGIN)
-
-    def get_atoms(self):
+        if level_of_detail not in LEVELS_OF_DETAIL:
+            raise ValueError(
+                f"Invalid level_of_detail {level_of_detail!r}, it must be one of "
+                f"{', '.join(repr(level) for level in LEVELS_OF_DETAIL)}"
+            )
+        with profiled_stage("MMoleculeObject"):
+            VGroup.__init__(self, **kwargs)
+            self.atoms_dict = atoms_dict
+            self.bonds_dict = bonds_dict
+            self.representation_type = representation_type
+            self.explicit_carbons = explicit_carbons
+            self.explicit_hydrogens = explicit_hydrogens
+            self.planar = planar
+            if level_of_detail == "auto":
+                level_of_detail = MMoleculeObject.choose_level_of_detail(
+                    len(atoms_dict), target_scale
+                )
+            self.level_of_detail = level_of_detail
+            with profiled_stage("MMoleculeObject.classify_bonds"):
+                self.bond_arrays, explicit_atoms = self.classify_bonds()
+            with profiled_stage("MMoleculeObject.get_atoms"):
+                self.atoms, self.atoms_by_index = self.get_atoms(explicit_atoms)
+            with profiled_stage("MMoleculeObject.find_rings"):
+                self.rings, self.bond_rings, self.ring_centers = self.find_rings()
+            with profiled_stage("MMoleculeObject.get_bonds"):
+                self.bonds, self.bonds_by_atom = self.get_bonds()
+            with profiled_stage("MMoleculeObject.rotate_bond"):
+                self.rotate_bond(rotate_bonds)
+            self.merged_bonds = None
+            self.bond_point_ranges = {}
+            if merge_bonds:
+                with profiled_stage("MMoleculeObject.merge_bonds"):
+                    self.merged_bonds, unmerged_bonds = self.merge_bonds()
+                self.add(self.atoms, VGroup(self.merged_bonds, *unmerged_bonds))
+            else:
+                self.add(self.atoms, self.bonds)
+            with profiled_stage("MMoleculeObject.numbering"):
+                if add_atoms_numbering:
+                    self.add_atom_numbering()
+                if add_bonds_numbering:
+                    self.add_bond_numbering()
+            with profiled_stage("MMoleculeObject.complete_missing_hydrogens"):
+                if self.level_of_detail < NO_LABELS:
+                    self.complete_missing_hydrogens()
+            with profiled_stage("MMoleculeObject.move_to_origin"):
+                self.coords_shift = ORIGIN - self.get_center()
+                self.shift(self.coords_shift)
+                for index in self.bond_point_ranges:
+                    self.bonds[index].shift(self.coords_shift)
+            self.frame_tracker = VMobject(
+                stroke_width=0, stroke_opacity=0, fill_opacity=0
+            ).set_points(frame_tracker_points())
+            self.add(self.frame_tracker)
+
+    def choose_level_of_detail(number_of_atoms: int, target_scale: float = None) -> int:
+        """
+        Level of detail for a molecule drawn at target_scale times its size,
+        so that details smaller than a few pixels at the output resolution
+        are not built. Without target_scale, it depends on the number of
+        atoms (LEVEL_OF_DETAIL_ATOMS).
+        """
+        if target_scale is None:
+            return sum(number_of_atoms > atoms for atoms in LEVEL_OF_DETAIL_ATOMS)
+
+        pixels_per_unit = config.pixel_height / config.frame_height * target_scale
+        if LABEL_HEIGHT * pixels_per_unit < MIN_LABEL_PIXELS:
+            return NO_LABELS
+        if DOUBLE_BOND_GAP * pixels_per_unit < MIN_BOND_GAP_PIXELS:
+            return SIMPLE_BONDS
+
+        return FULL_DETAIL
+
+    def get_atoms(self, explicit_atoms=()):
         atoms = VDict()
         atoms_by_index = {}
+        representation_type = self.representation_type
+        if self.level_of_detail >= NO_LABELS:
+            representation_type = "skeleton"
         for index, atom in self.atoms_dict.items():
             matom = MAtomObject(
                 coords=atom["coords"],
                 element=atom["element"],
                 explicit_carbons=self.explicit_carbons,
-                explicit_hydrogens=self.explicit_hydrogens,
-                representation_type=self.representation_type,
+                explicit_hydrogens=self.explicit_hydrogens or index in explicit_atoms,
+                representation_type=representation_type,
                 planar=self.planar,
                 bond_to=atom.get("bond_to"),
                 index=index,
@@ -56,146 +172,316 @@ class MMoleculeObject(VGroup):
 
         return atoms, atoms_by_index
 
-    def get_bonds(self):
-        bonds = VGroup()
-        bond_index = 0
+    def classify_bonds(self):
+        """
+        Decides how every bond is drawn with a single pass over the bond
+        arrays, before any atom is created. Returns:
+            - The from atoms, to atoms, types and kinds (index of their
+              class in BOND_CLASSES) of the bonds that are drawn, in the
+              order of bonds_dict.
+            - The atoms drawn with explicit hydrogens because they are in a
+              cram bond with a hydrogen.
+
+        Bonds with a hydrogen are only drawn when they are cram bonds or
+        when hydrogens are explicit. From the SIMPLE_BONDS level of detail,
+        double, triple and dashed cram bonds are simple bonds.
+        """
+        from_atoms, to_atoms, types, stereo = [], [], [], []
         for index, bond_list in self.bonds_dict.items():
             for bond in bond_list:
-                # TODO: Add logic to check type of bond
-                from_atom = self.atoms_by_index.get(index)
-                to_atom = self.atoms_by_index.get(bond.get("to"))
-                if from_atom.element == "H" or to_atom.element == "H":
-                    stereo = bond.get("stereo")
-                
-                    if stereo:
-                        if int(stereo) == 1 or int(stereo) == 4:
-                            self.atoms[
-                                from_atom.index
-                            ] = from_atom.copy_with_explicit_hydrogens()
-                            self.atoms[
-                                to_atom.index
-                            ] = to_atom.copy_with_explicit_hydrogens()
-                            from_atom = self.atoms[from_atom.index]
-                            to_atom = self.atoms[to_atom.index]
-                            new_bond = PlainCramBond(
-                                from_atom=from_atom,
-                                to_atom=to_atom,
-                                index=bond_index,
-                                type=bond_type,
-                            )
-
-                            bond_index += 1
-                            bonds.add(new_bond)
-
-                        elif int(stereo) == 6:
-                            self.atoms[
-                                from_atom.index
-                            ] = from_atom.copy_with_explicit_hydrogens()
-                            self.atoms[
-                                to_atom.index
-                            ] = to_atom.copy_with_explicit_hydrogens()
-                            from_atom = self.atoms[from_atom.index]
-                            to_atom = self.atoms[to_atom.index]
-                            new_bond = DashedCramBond(
-                                from_atom=from_atom,
-                                to_atom=to_atom,
-                                index=bond_index,
-                                type=bond_type,
-                            )
-
-                            bond_index += 1
-                            bonds.add(new_bond)
-                    
-                        else:
-                            
-                            continue
-                    # you don't need not x and not y
-                    # just use De Morgan's law ! (syntactic detail, doesn't change code)
-                    elif (from_atom.explicit_hydrogens) or (
-                        to_atom.explicit_hydrogens
-                    ):
-                        # make bonds to explicit hydrogens
-                        # TODO: clean repetitive code
-                        self.atoms[
-                                from_atom.index
-                            ] = from_atom.copy_with_explicit_hydrogens()
-                        self.atoms[
-                            to_atom.index
-                        ] = to_atom.copy_with_explicit_hydrogens()
-                        from_atom = self.atoms[from_atom.index]
-                        to_atom = self.atoms[to_atom.index]
-                        new_bond = SimpleBond(
-                            from_atom=from_atom,
-                            to_atom=to_atom,
-                            index=bond_index,
-                            type=bond_type,
-                        )
+                from_atoms.append(index)
+                to_atoms.append(bond.get("to"))
+                types.append(int(bond.get("type")))
+                stereo.append(int(bond.get("stereo") or 0))
 
-                        bond_index += 1
-                        bonds.add(new_bond)
+        from_atoms = np.array(from_atoms, dtype=np.int64)
+        to_atoms = np.array(to_atoms, dtype=np.int64)
+        types = np.array(types, dtype=np.int64)
+        stereo = np.array(stereo, dtype=np.int64)
+
+        hydrogens = [
+            index for index, atom in self.atoms_dict.items() if atom["element"] == "H"
+        ]
+        with_hydrogen = np.isin(from_atoms, hydrogens) | np.isin(to_atoms, hydrogens)
+        kinds = np.select(
+            [
+                with_hydrogen & np.isin(stereo, (1, 4)),
+                with_hydrogen & (stereo == 6),
+                with_hydrogen & ((stereo != 0) | (not self.explicit_hydrogens)),
+                with_hydrogen,
+                np.isin(types, (2, 5, 7)),
+                types == 3,
+                stereo == 1,
+                stereo != 0,
+            ],
+            [
+                PLAIN_CRAM_BOND,
+                DASHED_CRAM_BOND,
+                HIDDEN_BOND,
+                SIMPLE_BOND,
+                DOUBLE_BOND,
+                TRIPLE_BOND,
+                PLAIN_CRAM_BOND,
+                DASHED_CRAM_BOND,
+            ],
+            default=SIMPLE_BOND,
+        )
+
+        hydrogen_cram_bonds = with_hydrogen & np.isin(
+            kinds, (PLAIN_CRAM_BOND, DASHED_CRAM_BOND)
+        )
+        explicit_atoms = set(
+            np.concatenate(
+                [from_atoms[hydrogen_cram_bonds], to_atoms[hydrogen_cram_bonds]]
+            ).tolist()
+        )
+        if self.level_of_detail >= SIMPLE_BONDS:
+            kinds[np.isin(kinds, (DOUBLE_BOND, TRIPLE_BOND, DASHED_CRAM_BOND))] = (
+                SIMPLE_BOND
+            )
+        drawn = kinds != HIDDEN_BOND
+
+        return (
+            from_atoms[drawn],
+            to_atoms[drawn],
+            types[drawn],
+            kinds[drawn],
+        ), explicit_atoms
+
+    def get_bonds(self):
+        bonds = VGroup()
+        bonds_by_atom = {}
+        from_atoms, to_atoms, types, kinds = self.bond_arrays
+        for bond_index, (from_index, to_index, bond_type, kind) in enumerate(
+            zip(from_atoms.tolist(), to_atoms.tolist(), types.tolist(), kinds.tolist())
+        ):
+            side_kwargs = {}
+            if kind == DOUBLE_BOND:
+                side_kwargs["side"] = self.double_bond_side(from_index, to_index)
+            new_bond = BOND_CLASSES[kind](
+                from_atom=self.atoms_by_index.get(from_index),
+                to_atom=self.atoms_by_index.get(to_index),
+                index=bond_index,
+                type=bond_type,
+                **side_kwargs,
+            )
+            bonds.add(new_bond)
+            bonds_by_atom.setdefault(from_index, []).append(new_bond)
+            bonds_by_atom.setdefault(to_index, []).append(new_bond)
+
+        return bonds, bonds_by_atom
+
+    def find_rings(self):
+        """
+        Finds the smallest set of smallest rings of the drawn bonds. Returns
+        the rings (tuples of atom indices), a dict from every ring bond, as
+        its (lower, higher) atom indices, to the index of the smallest ring
+        it is in, and the center of every ring.
+        """
+        from_atoms, to_atoms = self.bond_arrays[0], self.bond_arrays[1]
+        rings = find_rings(from_atoms, to_atoms)
+
+        bond_rings = {}
+        ring_centers = []
+        for ring_index, ring in enumerate(rings):
+            ring_centers.append(
+                np.mean([self.atoms_by_index[index].coords for index in ring], axis=0)
+            )
+            for from_index, to_index in zip(ring, ring[1:] + ring[:1]):
+                pair = (min(from_index, to_index), max(from_index, to_index))
+                bond_rings.setdefault(pair, ring_index)
+
+        return rings, bond_rings, ring_centers
+
+    def double_bond_side(self, from_index: int, to_index: int) -> int:
+        """
+        Side of the bond from from_index to to_index where the center of its
+        ring is: 1 along its perpendicular vector (direction x OUT), -1 on
+        the other side and 0 if the bond is not in a ring.
+        """
+        ring_index = self.bond_rings.get(
+            (min(from_index, to_index), max(from_index, to_index))
+        )
+        if ring_index is None:
+            return 0
+
+        from_coords = self.atoms_by_index[from_index].coords
+        direction = self.atoms_by_index[to_index].coords - from_coords
+        perpendicular = np.cross(direction, np.array([0, 0, 1]))
+        if np.dot(self.ring_centers[ring_index] - from_coords, perpendicular) > 0:
+            return 1
+        return -1
+
+    def update_rings(self, moved_atoms) -> list:
+        """
+        Computes again the centers of the rings with any of moved_atoms and
+        the side of the double bonds in them. Returns the double bonds whose
+        side changed, which have to be created again.
+        """
+        changed_bonds = []
+        for ring_index, ring in enumerate(self.rings):
+            if moved_atoms.isdisjoint(ring):
+                continue
+            self.ring_centers[ring_index] = np.mean(
+                [self.atoms_by_index[index].coords for index in ring], axis=0
+            )
+            for index in ring:
+                for bond in self.get_atom_bonds(index):
+                    if not isinstance(bond, DoubleBond):
                         continue
+                    side = self.double_bond_side(
+                        bond.from_atom.index, bond.to_atom.index
+                    )
+                    if side != bond.side:
+                        bond.side = side
+                        changed_bonds.append(bond)
 
-                else:
-                    bond_type = int(bond.get("type"))
-                    if bond_type == 2 or bond_type == 5 or bond_type == 7:
-                        new_bond = DoubleBond(  # TODO: Add function inside bond to create it from data
-                            from_atom=from_atom,
-                            to_atom=to_atom,
-                            index=bond_index,
-                            type=bond_type,
-                        )
-                    elif bond_type == 3:
-                        new_bond = TripleBond(
-                            from_atom=from_atom,
-                            to_atom=to_atom,
-                            index=bond_index,
-                            type=bond_type,
-                        )
-                    else:
-                        if bond.get("stereo"):
-                            if int(bond.get("stereo")) == 1:
-                                new_bond = PlainCramBond(
-                                    from_atom=from_atom,
-                                    to_atom=to_atom,
-                                    index=bond_index,
-                                    type=bond_type,
-                                )
-
-                            else:
-                                new_bond = DashedCramBond(
-                                    from_atom=from_atom,
-                                    to_atom=to_atom,
-                                    index=bond_index,
-                                    type=bond_type,
-                                )
-                        else:
-                            new_bond = SimpleBond(
-                                from_atom=from_atom,
-                                to_atom=to_atom,
-                                index=bond_index,
-                                type=bond_type,
-                            )
-                    bond_index += 1
-                    bonds.add(new_bond)
+        return changed_bonds
 
-        
-        return bonds
+    def merge_bonds(self):
+        """
+        Packs the strokes of every bond but plain cram bonds (which are
+        filled) into a single VMobject, with a subpath per line, so big
+        molecules have few mobjects to move and draw. Fills
+        bond_point_ranges with the (start, end) range of the points of
+        every merged bond.
+
+        Returns the merged VMobject and the bonds that weren't merged.
+        """
+        kinds = self.bond_arrays[3]
+        points = []
+        unmerged_bonds = []
+        style = None
+        start = 0
+        for bond, kind in zip(self.bonds, kinds.tolist()):
+            if kind == PLAIN_CRAM_BOND:
+                unmerged_bonds.append(bond)
+                continue
+
+            lines = bond.family_members_with_points()
+            if style is None and lines:
+                style = lines[0]
+            points += [line.points for line in lines]
+            end = start + sum(len(line.points) for line in lines)
+            self.bond_point_ranges[bond.index] = (start, end)
+            start = end
+
+        merged_bonds = VMobject()
+        if points:
+            merged_bonds.set_points(np.concatenate(points))
+            merged_bonds.match_style(style)
+
+        return merged_bonds, unmerged_bonds
+
+    def get_merged_bond(self, index: int) -> VMobject:
+        """
+        Returns a copy of the strokes of a merged bond, to highlight it
+        (for example, with set_color) over the merged bonds.
+        """
+        start, end = self.bond_point_ranges[index]
+        bond = VMobject()
+        bond.set_points(self.merged_bonds.points[start:end])
+
+        return bond.match_style(self.merged_bonds)
+
+    def get_frame_transform(self):
+        """
+        Returns the matrix and the origin that take a point of the frame of
+        the centered molecule (coordinates plus coords_shift) to where it is
+        now, after every transformation the molecule got.
+        """
+        return frame_transform(self.frame_tracker.points)
+
+    def update_coordinates(self, new_coords):
+        """
+        Moves the atoms to new_coords, an (N, 3) array with the coordinates
+        of every atom in the order of atoms_dict, in the frame of the
+        coordinates the molecule was created from. They get the same
+        centering and transformations (shift, scale, rotate, next_to...)
+        the molecule got after being created.
+
+        Only the bonds of the atoms that moved are created again, so it can
+        be called from updaters of big molecules. Numbering is not moved.
+        """
+        new_coords = np.array(new_coords, dtype=np.float64).reshape(-1, 3)
+        if self.planar:
+            new_coords[:, 2] = 0
+        matrix, origin = self.get_frame_transform()
+
+        atoms = list(self.atoms_by_index.values())
+        old_coords = np.array([atom.coords for atom in atoms], dtype=np.float64)
+        moved_atoms = set()
+        moved_bonds = {}
+        for position in np.flatnonzero((old_coords != new_coords).any(axis=1)).tolist():
+            atom = atoms[position]
+            atom.shift(matrix @ (new_coords[position] - old_coords[position]))
+            atom.coords = new_coords[position]
+            moved_atoms.add(atom.index)
+            for bond in self.get_atom_bonds(atom.index):
+                moved_bonds[bond.index] = bond
+        for bond in self.update_rings(moved_atoms):
+            moved_bonds[bond.index] = bond
+
+        for bond in moved_bonds.values():
+            bond.update_line(self.coords_shift)
+            # Merged bonds stay in the frame of the centered molecule
+            if bond.index not in self.bond_point_ranges:
+                bond.apply_matrix(matrix).shift(origin)
+        if self.merged_bonds is not None:
+            self.update_merged_bonds(moved_bonds.values(), matrix, origin)
+
+        return self
+
+    def update_merged_bonds(self, bonds, matrix=np.identity(3), origin=ORIGIN):
+        """
+        Copies the points of bonds to their ranges of merged_bonds, taken to
+        where the molecule is now with matrix and origin (see
+        get_frame_transform). If the number of points of any of them
+        changed, the bonds are merged again.
+        """
+        updates = []
+        for bond in bonds:
+            if bond.index not in self.bond_point_ranges:
+                continue
+            start, end = self.bond_point_ranges[bond.index]
+            lines = bond.family_members_with_points()
+            points = [line.points for line in lines]
+            if sum(len(line_points) for line_points in points) != end - start:
+                merged_points = self.merge_bonds()[0].points
+                self.merged_bonds.set_points(merged_points @ matrix.T + origin)
+                return
+            if points:
+                updates.append((start, end, np.concatenate(points)))
+
+        for start, end, points in updates:
+            self.merged_bonds.points[start:end] = points @ matrix.T + origin
+
+    def get_atom_bonds(self, index: int) -> list:
+        """
+        Returns the drawn bonds of the atom with the given index.
+        """
+        return self.bonds_by_atom.get(index, [])
+
+    def replace_atom(self, index: int, new_atom: MAtomObject):
+        """
+        Puts new_atom in place of the atom with the given index, also in
+        atoms_by_index and in its bonds.
+        """
+        old_atom = self.atoms_by_index[index]
+        self.atoms[index] = new_atom
+        self.atoms_by_index[index] = new_atom
+        for bond in self.get_atom_bonds(index):
+            if bond.from_atom is old_atom:
+                bond.from_atom = new_atom
+            if bond.to_atom is old_atom:
+                bond.to_atom = new_atom
 
     def add_atom_numbering(self):
         numbering = VGroup()
         for atom in self.atoms:
-            if not self.explicit_hydrogens:
-                if atom.element != "H":
-                    numbering.add(
-                        MarkupText(str(atom.index))
-                        .scale(0.5)
-                        .move_to(atom.coords + 0.5 * RIGHT)
-                        .set_color(RED)
-                    )
-            else:
+            if self.explicit_hydrogens or atom.element != "H":
                 numbering.add(
-                    MarkupText(str(atom.index))
-                    .scale(0.5)
+                    get_number_label(atom.index, scale=0.5)
                     .move_to(atom.coords + 0.5 * RIGHT)
                     .set_color(RED)
                 )
@@ -211,10 +497,9 @@ class MMoleculeObject(VGroup):
             ):
                 if bond.from_atom.element != "H" and bond.to_atom.element != "H":
                     numbering.add(
-                        MarkupText(str(bond.index))
+                        get_number_label(bond.index, scale=0.5)
                         .set_color(GREEN)
                         .move_to(bond.get_center())
-                        .scale(0.5)
                     )
 
         self.add(numbering)
@@ -224,17 +509,14 @@ class MMoleculeObject(VGroup):
             rotate_bonds = [rotate_bonds]
             
         for bond in rotate_bonds:
-            direction = self.bonds[bond][0][0].end - self.bonds[bond][0][0].start
-            self.bonds[bond].rotate(
-                PI, about_point=self.bonds[bond][0][0].get_center(), axis=direction
-            )
+            self.bonds[bond].flip()
             
         return self
 
     def complete_missing_hydrogens(self):
         supported_atoms = ["O", "S", "N", "P"]
 
-        for atom in self.atoms:
+        for atom in list(self.atoms):
             if atom.element not in supported_atoms:
                 continue
 
@@ -242,8 +524,8 @@ class MMoleculeObject(VGroup):
             bonds_direction = 0
             if not atom.bonds_fulfilled():
                 minimum_bonds = {"O": 2, "S": 2, "N": 3, "P": 3}
-                for bond in self.bonds:
-                    if bond.atom_is_in_bond(atom) and 0 < bond.type <= 4:
+                for bond in self.get_atom_bonds(atom.index):
+                    if 0 < bond.type <= 4:
                         total_bonds += bond.type - 1
                         bonds_direction += (
                             bond.to_atom.coords[0] - bond.from_atom.coords[0]
@@ -253,28 +535,57 @@ class MMoleculeObject(VGroup):
                     needed_hydrogens = minimum_bonds.get(atom.element) - total_bonds
                     if bonds_direction < 0:
                         if needed_hydrogens > 1:
-                            self.atoms[atom.index] = atom.rename_atom(
-                                f"H<sub>{needed_hydrogens}</sub>" + atom.element,
-                                bonds_direction,
-                            )
+                            new_name = f"H<sub>{needed_hydrogens}</sub>" + atom.element
                         else:
-                            self.atoms[atom.index] = atom.rename_atom(
-                                "H" + atom.element, bonds_direction
-                            )
+                            new_name = "H" + atom.element
                     else:
                         if needed_hydrogens > 1:
-                            self.atoms[atom.index] = atom.rename_atom(
-                                atom.element + f"H<sub>{needed_hydrogens}</sub>",
-                                bonds_direction,
-                            )
+                            new_name = atom.element + f"H<sub>{needed_hydrogens}</sub>"
                         else:
-                            self.atoms[atom.index] = atom.rename_atom(
-                                atom.element + "H", bonds_direction
-                            )
+                            new_name = atom.element + "H"
+                    self.replace_atom(
+                        atom.index, atom.rename_atom(new_name, bonds_direction)
+                    )
 
     def from_mol_file(filename, *args, **kwargs):
-        atoms, bonds = mol_parser(filename)
-        return MMoleculeObject(atoms, bonds, *args, **kwargs)
+        """
+        Creates the molecule of a .mol file. The first molecule made from
+        each file contents and arguments is kept, and later calls return
+        copies of it instead of building it again. Copies share nothing
+        with the kept molecule.
+        """
+        with profiled_stage("MMoleculeObject.from_mol_file"):
+            key = (
+                file_hash(filename),
+                _frozen(args),
+                _frozen(kwargs),
+                config.pixel_height,
+                config.frame_height,
+            )
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+
+            with _prototypes_lock:
+                prototype = _prototypes.get(key)
+                if prototype is not None:
+                    _prototypes.move_to_end(key)
+
+            if prototype is None:
+                molecule = cached_mol_array_parser(filename)
+                prototype = MMoleculeObject.from_molecule_arrays(molecule, *args, **kwargs)
+                if key is None:
+                    return prototype
+                with _prototypes_lock:
+                    _prototypes[key] = prototype
+                    while len(_prototypes) > MOLECULE_PROTOTYPES:
+                        _prototypes.popitem(last=False)
+
+            return prototype.copy()
+
+    def from_molecule_arrays(molecule, *args, **kwargs):
+        return MMoleculeObject(molecule.atoms_dict, molecule.bonds_dict, *args, **kwargs)
 
 
 class NamedMolecule(VGroup):
@@ -1 +1,19 @@
-from .utils import mol_parser, get_symbol_to_atomic_number
+from .utils import (
+    mol_parser,
+    mol_array_parser,
+    mol_block_parser,
+    mol_block_array_parser,
+    get_symbol_to_atomic_number,
+)
+from .molecule_arrays import MoleculeArrays
+from .sdf_parser import sdf_parser, SDFRecord
+from .molecule_cache import (
+    cached_mol_array_parser,
+    clear_molecule_cache,
+    molecule_cache_stats,
+)
+from .molecule_loader import load_molecules, LoadedMolecule
+from .pdb_parser import pdb_parser, mmcif_parser
+from .xyz_parser import xyz_parser
+from .bond_perception import find_bonds, perceive_bonds
+from .rings import find_rings
@@ -0,0 +1,122 @@
+import itertools
+
+import numpy as np
+
+from ..element import get_element_table
+from .molecule_arrays import MoleculeArrays, MISSING
+
+# Two atoms are bonded when their distance (in angstroms) is at least
+# MIN_BOND_DISTANCE and at most the sum of their covalent radii plus
+# BOND_TOLERANCE.
+BOND_TOLERANCE = 0.45
+MIN_BOND_DISTANCE = 0.4
+
+# A cell and half of its neighbours, so every pair of neighbouring cells is
+# compared once.
+CELL_OFFSETS = [(0, 0, 0)] + [
+    offset for offset in itertools.product((-1, 0, 1), repeat=3) if offset > (0, 0, 0)
+]
+
+
+def find_bonds(
+    coords,
+    radii,
+    tolerance: float = BOND_TOLERANCE,
+    min_distance: float = MIN_BOND_DISTANCE,
+):
+    """
+    Returns the bonded pairs of atoms as two arrays, first atoms and second
+    atoms, with the first atom of every pair lower than the second one.
+
+    Atoms are sorted into cells as big as the longest possible bond, so
+    each atom is only compared with the atoms of its cell and the 26
+    around it. This takes linear time for any molecule, instead of
+    comparing every pair of atoms.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    radii = np.asarray(radii, dtype=np.float64)
+    if len(coords) < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    cell_size = 2 * radii.max() + tolerance
+    # Cells start at 1, so neighbours of the border cells are still valid
+    cells = np.floor((coords - coords.min(axis=0)) / cell_size).astype(np.int64) + 1
+    grid = cells.max(axis=0) + 2
+    strides = np.array([grid[1] * grid[2], grid[2], 1])
+    keys = cells @ strides
+
+    order = np.argsort(keys, kind="stable")
+    cell_keys, starts, counts = np.unique(
+        keys[order], return_index=True, return_counts=True
+    )
+
+    bond_from = []
+    bond_to = []
+    for offset in CELL_OFFSETS:
+        neighbour_keys = cell_keys + np.dot(offset, strides)
+        positions = np.minimum(
+            np.searchsorted(cell_keys, neighbour_keys), len(cell_keys) - 1
+        )
+        found = cell_keys[positions] == neighbour_keys
+        cell, neighbour = np.flatnonzero(found), positions[found]
+
+        # Every atom of the cell with every atom of the neighbour cell
+        pairs = counts[cell] * counts[neighbour]
+        pair_cell = np.repeat(np.arange(len(cell)), pairs)
+        pair_index = np.arange(pairs.sum()) - np.repeat(np.cumsum(pairs) - pairs, pairs)
+        neighbour_counts = counts[neighbour][pair_cell]
+        atoms = order[starts[cell][pair_cell] + pair_index // neighbour_counts]
+        others = order[starts[neighbour][pair_cell] + pair_index % neighbour_counts]
+        if offset == (0, 0, 0):
+            atoms, others = atoms[atoms < others], others[atoms < others]
+
+        vectors = coords[atoms] - coords[others]
+        squared_distances = np.einsum("ij,ij->i", vectors, vectors)
+        max_distances = radii[atoms] + radii[others] + tolerance
+        bonded = (squared_distances <= max_distances**2) & (
+            squared_distances >= min_distance**2
+        )
+        bond_from.append(np.minimum(atoms, others)[bonded])
+        bond_to.append(np.maximum(atoms, others)[bonded])
+
+    bond_from = np.concatenate(bond_from)
+    bond_to = np.concatenate(bond_to)
+    bond_order = np.lexsort((bond_to, bond_from))
+
+    return bond_from[bond_order], bond_to[bond_order]
+
+
+def perceive_bonds(
+    molecule: MoleculeArrays, element_file_path, tolerance: float = BOND_TOLERANCE
+) -> MoleculeArrays:
+    """
+    Returns a copy of molecule with single bonds between the atoms that are
+    close enough to be bonded, for files that only have coordinates (.xyz,
+    most .pdb). The covalent radii come from the element table. Bonds the
+    molecule already had are kept as they were.
+    """
+    radii = get_element_table(element_file_path).covalent_radii_for(molecule.elements)
+    found_from, found_to = find_bonds(molecule.coords, radii, tolerance)
+
+    number_of_atoms = molecule.number_of_atoms
+    known = np.minimum(
+        molecule.bond_from, molecule.bond_to
+    ) * number_of_atoms + np.maximum(molecule.bond_from, molecule.bond_to)
+    new = ~np.isin(found_from * number_of_atoms + found_to, known)
+    new_bonds = np.count_nonzero(new)
+
+    def with_new_bonds(values, new_value):
+        return np.concatenate([values, np.full(new_bonds, new_value, dtype=np.int64)])
+
+    return MoleculeArrays(
+        coords=molecule.coords,
+        elements=molecule.elements,
+        bond_from=np.concatenate([molecule.bond_from, found_from[new]]),
+        bond_to=np.concatenate([molecule.bond_to, found_to[new]]),
+        bond_types=with_new_bonds(molecule.bond_types, 1),
+        bond_stereo=with_new_bonds(molecule.bond_stereo, MISSING),
+        bond_topology=with_new_bonds(molecule.bond_topology, MISSING),
+        bond_reacting_center=with_new_bonds(molecule.bond_reacting_center, MISSING),
+        name=molecule.name,
+        data=molecule.data,
+    )
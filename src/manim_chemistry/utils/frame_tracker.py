@@ -0,0 +1,36 @@
+from typing import Tuple
+
+import numpy as np
+
+# Half the length of the axes of a frame tracker. Small enough to stay
+# inside any molecule, so adding a tracker doesn't change its size.
+FRAME_TRACKER_SIZE = 1e-3
+
+
+def frame_tracker_points() -> np.ndarray:
+    """
+    Points of a frame tracker: the ends of the X, Y and Z axes, centered at
+    the origin, followed by the origin. There are 12 points, so they make
+    whole curves of both cubic (Cairo) and quadratic (OpenGL) VMobjects.
+
+    A tracker added to a molecule gets every transformation the molecule
+    gets (shift, scale, rotate, next_to, animations...), so frame_transform
+    can tell where its original frame is.
+    """
+    axes = [sign * axis for axis in np.eye(3) for sign in (-1, 1)]
+
+    return np.vstack([axes, np.zeros((6, 3))]) * FRAME_TRACKER_SIZE
+
+
+def frame_transform(points) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the matrix and the origin of the affine transformation that
+    took frame_tracker_points to points, so a point of the original frame
+    is now at matrix @ point + origin. Non-affine transformations (such as
+    apply_function) are approximated around the tracker.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    matrix = (points[1:6:2] - points[0:6:2]).T / (2 * FRAME_TRACKER_SIZE)
+    origin = (points[1:6:2] + points[0:6:2]).mean(axis=0) / 2
+
+    return matrix, origin
@@ -0,0 +1,193 @@
+from functools import cached_property
+from typing import Any, Dict, List
+
+import numpy as np
+
+# Value of optional integer fields (stereo, topology...) missing in the file.
+MISSING = -1
+
+
+class MoleculeArrays:
+    """
+    Array form of a parsed molecule. Atoms are numbered from 0 here, while
+    the atoms and bonds dicts number them from 1 like the .mol file does.
+
+    Atoms:
+        - coords: (N, 3) float array.
+        - element_symbols: (K,) str array with the different elements.
+        - element_codes: (N,) int array, index of each atom's element in
+          element_symbols.
+
+    Bonds:
+        - bond_from, bond_to: (E,) int arrays with the bonded atoms.
+        - bond_types, bond_stereo, bond_topology, bond_reacting_center:
+          (E,) int arrays. Optional fields missing in the file are MISSING.
+
+    Adjacency, in CSR form: the neighbours of atom i are
+    adjacency_indices[adjacency_indptr[i]:adjacency_indptr[i + 1]] and the
+    bonds joining them are adjacency_bonds in the same range. Neighbours
+    are in the same order the bonds have in the file.
+    """
+
+    def __repr__(self) -> str:
+        return f"MoleculeArrays {self.name!r} with {self.number_of_atoms} atoms and {self.number_of_bonds} bonds"
+
+    def __init__(
+        self,
+        coords,
+        elements,
+        bond_from,
+        bond_to,
+        bond_types,
+        bond_stereo=None,
+        bond_topology=None,
+        bond_reacting_center=None,
+        name: str = "",
+        data: Dict[str, str] = None,
+    ):
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+        self.element_symbols, self.element_codes = np.unique(
+            np.asarray(elements, dtype=str), return_inverse=True
+        )
+        self.element_codes = self.element_codes.reshape(-1)
+        self.bond_from = np.asarray(bond_from, dtype=np.int64).reshape(-1)
+        self.bond_to = np.asarray(bond_to, dtype=np.int64).reshape(-1)
+        self.bond_types = np.asarray(bond_types, dtype=np.int64).reshape(-1)
+        self.bond_stereo = self._optional_field(bond_stereo)
+        self.bond_topology = self._optional_field(bond_topology)
+        self.bond_reacting_center = self._optional_field(bond_reacting_center)
+        self.name = name
+        self.data = data or {}
+
+        bonded_atoms = np.concatenate([self.bond_from, self.bond_to])
+        if bonded_atoms.size and (
+            bonded_atoms.min() < 0 or bonded_atoms.max() >= self.number_of_atoms
+        ):
+            raise Exception(
+                f"Bonds of {name or 'molecule'} reference atoms that don't exist. It has {self.number_of_atoms} atoms"
+            )
+
+        self.adjacency_indptr, self.adjacency_indices, self.adjacency_bonds = (
+            self.build_adjacency()
+        )
+
+    def _optional_field(self, values) -> np.ndarray:
+        if values is None:
+            return np.full(self.number_of_bonds, MISSING, dtype=np.int64)
+
+        return np.asarray(values, dtype=np.int64).reshape(-1)
+
+    @property
+    def number_of_atoms(self) -> int:
+        return len(self.coords)
+
+    @property
+    def number_of_bonds(self) -> int:
+        return len(self.bond_from)
+
+    @property
+    def elements(self) -> np.ndarray:
+        return self.element_symbols[self.element_codes]
+
+    def build_adjacency(self):
+        """
+        Builds the CSR adjacency. Every bond is stored in both directions
+        and a stable sort keeps each atom's neighbours in file order.
+        """
+        sources = np.stack([self.bond_from, self.bond_to], axis=1).reshape(-1)
+        targets = np.stack([self.bond_to, self.bond_from], axis=1).reshape(-1)
+        bonds = np.repeat(np.arange(self.number_of_bonds), 2)
+
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(self.number_of_atoms + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(sources, minlength=self.number_of_atoms), out=indptr[1:]
+        )
+
+        return indptr, targets[order], bonds[order]
+
+    def neighbours(self, atom: int) -> np.ndarray:
+        start, end = self.adjacency_indptr[atom], self.adjacency_indptr[atom + 1]
+        return self.adjacency_indices[start:end]
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.adjacency_indptr)
+
+    @cached_property
+    def atoms_dict(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Atoms in the dict form mol_parser returns.
+        """
+        elements = self.elements.tolist()
+        neighbours = self.adjacency_indices.tolist()
+        indptr = self.adjacency_indptr.tolist()
+
+        atoms = {}
+        # Rows of a single copy, so changing an atom's coords doesn't change
+        # the arrays.
+        for index, (coords, element) in enumerate(zip(self.coords.copy(), elements)):
+            atom = {"coords": coords, "element": element}
+            if indptr[index] < indptr[index + 1]:
+                atom["bond_to"] = {
+                    neighbour + 1: elements[neighbour]
+                    for neighbour in neighbours[indptr[index] : indptr[index + 1]]
+                }
+            atoms[index + 1] = atom
+
+        return atoms
+
+    @cached_property
+    def bonds_dict(self) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Bonds in the dict form mol_parser returns, grouped by their first atom.
+        """
+        bond_list = [
+            {"to": to_atom, "type": str(bond_type)}
+            for to_atom, bond_type in zip(
+                (self.bond_to + 1).tolist(), self.bond_types.tolist()
+            )
+        ]
+        for key, values in (
+            ("stereo", self.bond_stereo),
+            ("topology", self.bond_topology),
+            ("reacting_center_status", self.bond_reacting_center),
+        ):
+            present = values != MISSING
+            if present.all():
+                for bond_data, value in zip(bond_list, values.tolist()):
+                    bond_data[key] = value
+            elif present.any():
+                for bond in np.flatnonzero(present).tolist():
+                    bond_list[bond][key] = int(values[bond])
+
+        bonds = {}
+        for from_atom, bond_data in zip((self.bond_from + 1).tolist(), bond_list):
+            bonds.setdefault(from_atom, []).append(bond_data)
+
+        return bonds
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "coords": self.coords,
+            "elements": self.elements,
+            "bond_from": self.bond_from,
+            "bond_to": self.bond_to,
+            "bond_types": self.bond_types,
+            "bond_stereo": self.bond_stereo,
+            "bond_topology": self.bond_topology,
+            "bond_reacting_center": self.bond_reacting_center,
+            "name": np.array(self.name),
+        }
+
+    def from_arrays(arrays: Dict[str, np.ndarray]) -> "MoleculeArrays":
+        return MoleculeArrays(
+            coords=arrays["coords"],
+            elements=arrays["elements"],
+            bond_from=arrays["bond_from"],
+            bond_to=arrays["bond_to"],
+            bond_types=arrays["bond_types"],
+            bond_stereo=arrays["bond_stereo"],
+            bond_topology=arrays["bond_topology"],
+            bond_reacting_center=arrays["bond_reacting_center"],
+            name=str(arrays["name"]),
+        )
@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+from .molecule_arrays import MoleculeArrays
+from .molecule_cache import cached_mol_array_parser
+
+
+class LoadedMolecule(NamedTuple):
+    """
+    Result of loading a file with load_molecules:
+        - path: the file, as it was given.
+        - molecule: the molecule as MoleculeArrays, None if it failed.
+        - error: the exception raised while parsing the file, or None.
+
+    atoms and bonds give the same dicts as mol_parser returns.
+    """
+
+    path: Any
+    molecule: MoleculeArrays
+    error: Exception
+
+    @property
+    def atoms(self) -> Dict[int, Dict[str, Any]]:
+        return self.molecule.atoms_dict
+
+    @property
+    def bonds(self) -> Dict[int, List[Dict[str, Any]]]:
+        return self.molecule.bonds_dict
+
+
+def _load_molecule(path) -> LoadedMolecule:
+    try:
+        return LoadedMolecule(path, cached_mol_array_parser(path), None)
+    except Exception as error:
+        return LoadedMolecule(path, None, error)
+
+
+def _pool_result(future, path) -> LoadedMolecule:
+    """
+    Result of a file loaded in the pool. Files whose result can't be sent
+    back (exceptions that can't be pickled) are loaded again in this
+    process, and files lost because a worker died get the pool error.
+    """
+    try:
+        return future.result()
+    except BrokenProcessPool as error:
+        return LoadedMolecule(path, None, error)
+    except Exception:
+        return _load_molecule(path)
+
+
+def load_molecules(paths: Iterable, workers: int = None) -> List[LoadedMolecule]:
+    """
+    Parses many .mol files in a pool of worker processes. Returns a
+    LoadedMolecule per file, in the same order as paths. A file that can't
+    be parsed gets its error instead of stopping the others, also if its
+    worker crashes.
+
+    Only parsing happens in the workers. Mobjects have to be created in the
+    main process, for example with MMoleculeObject.from_molecule_arrays.
+
+    workers defaults to the number of CPUs. With 1 worker (or a single
+    file) files are parsed in this process.
+    """
+    paths = list(paths)
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return [_load_molecule(path) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_load_molecule, path) for path in paths]
+        return [_pool_result(future, path) for future, path in zip(futures, paths)]
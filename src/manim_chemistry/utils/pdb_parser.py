@@ -0,0 +1,271 @@
+import re
+from contextlib import contextmanager
+from typing import Collection, Iterator, List
+
+import numpy as np
+
+from .molecule_arrays import MoleculeArrays
+
+# Values of mmCIF fields: quoted strings (which can contain the quote when
+# it isn't followed by a space) or anything up to the next space.
+CIF_TOKEN = re.compile(r"""'(?:[^']|'(?=\S))*'|"(?:[^"]|"(?=\S))*"|\S+""")
+# mmCIF placeholders of missing and not applicable values
+CIF_EMPTY = ("?", ".")
+
+
+@contextmanager
+def _open_text(file):
+    """
+    Opens file if it is a path. Open files (for example
+    gzip.open(path, "rt")) are used as they are.
+    """
+    if hasattr(file, "read"):
+        yield file
+    else:
+        with open(file) as text_file:
+            yield text_file
+
+
+def _element_symbol(symbol: str, atom_name: str) -> str:
+    """
+    Returns the element symbol capitalized like in the elements csv. Old
+    files without element column get it from the atom name (columns 13-16):
+        - Names starting with a space or a digit (" CA ", "1HG1") have a
+          one letter element in column 14.
+        - Four letter names starting with H ("HG12") are hydrogens.
+        - Otherwise the element is right-justified in columns 13-14
+          ("CA  " is calcium, "FE  " is iron).
+    """
+    symbol = symbol.strip()
+    if not symbol:
+        atom_name = atom_name.ljust(4)
+        if atom_name[0] in " 0123456789":
+            symbol = atom_name[1]
+        elif atom_name[0] == "H" and atom_name[3] != " ":
+            symbol = "H"
+        else:
+            symbol = atom_name[:2].strip()
+
+    return symbol.capitalize()
+
+
+class _AtomSelection:
+    """
+    Keeps the selected atoms of a structure while it is being read.
+    """
+
+    def __init__(self, chains, residues, altloc):
+        self.chains = set(chains) if chains is not None else None
+        self.residues = set(residues) if residues is not None else None
+        self.altloc = altloc
+
+        self.coords = []
+        self.elements = []
+        self.serials = {}
+
+    def accepts(self, chain, residue_name, residue_number, altloc) -> bool:
+        if self.chains is not None and chain not in self.chains:
+            return False
+        if self.residues is not None and (
+            residue_name not in self.residues and residue_number not in self.residues
+        ):
+            return False
+        if self.altloc is not None and altloc and altloc != self.altloc:
+            return False
+
+        return True
+
+    def add(self, serial, coords, element):
+        if serial is not None:
+            self.serials[serial] = len(self.coords)
+        self.coords.append(coords)
+        self.elements.append(element)
+
+    def molecule(self, bonds, name) -> MoleculeArrays:
+        bonds = np.array(sorted(bonds), dtype=np.int64).reshape(-1, 2)
+        return MoleculeArrays(
+            coords=np.array(self.coords, dtype=np.float64).reshape(-1, 3),
+            elements=self.elements,
+            bond_from=bonds[:, 0],
+            bond_to=bonds[:, 1],
+            bond_types=np.ones(len(bonds), dtype=np.int64),
+            name=name,
+        )
+
+
+def _int_or_none(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def pdb_parser(
+    file,
+    chains: Collection[str] = None,
+    residues: Collection = None,
+    altloc: str or None = "A",
+    model: int = 1,
+    hetero_atoms: bool = True,
+) -> MoleculeArrays:
+    """
+    Parses a .pdb file into MoleculeArrays. The file is read line by line
+    and only the selected atoms are kept, so big structures can be loaded
+    in parts:
+        - chains: chain identifiers to keep. All of them by default.
+        - residues: residue names ("HEM") and/or residue numbers (42) to
+          keep. All of them by default.
+        - altloc: alternate location to keep for atoms that have more than
+          one. None keeps all of them.
+        - model: model to read from files with several (NMR structures).
+        - hetero_atoms: whether HETATM records (ligands, water...) are kept.
+
+    Bonds come from the CONECT records. Proteins and nucleic acids usually
+    only have them for their hetero atoms.
+
+    file can be a path or an open text file.
+    """
+    selection = _AtomSelection(chains, residues, altloc)
+    records = ("ATOM  ", "HETATM") if hetero_atoms else ("ATOM  ",)
+    bonds = set()
+    name = ""
+    current_model = None
+
+    with _open_text(file) as pdb_file:
+        for line in pdb_file:
+            record = line[:6]
+            if record in ("ATOM  ", "HETATM"):
+                if current_model not in (None, model) or record not in records:
+                    continue
+                atom_name = line[12:16]
+                if not selection.accepts(
+                    line[21], line[17:20].strip(), _int_or_none(line[22:26]), line[16].strip()
+                ):
+                    continue
+                selection.add(
+                    _int_or_none(line[6:11]),
+                    (float(line[30:38]), float(line[38:46]), float(line[46:54])),
+                    _element_symbol(line[76:78], atom_name),
+                )
+
+            elif record == "CONECT":
+                from_atom = selection.serials.get(_int_or_none(line[6:11]))
+                if from_atom is None:
+                    continue
+                for start in range(11, 31, 5):
+                    to_atom = selection.serials.get(_int_or_none(line[start : start + 5]))
+                    if to_atom is not None and to_atom != from_atom:
+                        bonds.add((min(from_atom, to_atom), max(from_atom, to_atom)))
+
+            elif record == "MODEL ":
+                current_model = _int_or_none(line[10:14])
+            elif record == "HEADER" and not name:
+                name = line[62:66].strip() or line[10:50].strip()
+
+    return selection.molecule(bonds, name)
+
+
+def _cif_tokens(line: str) -> List[str]:
+    return [
+        token[1:-1] if token[0] in "'\"" else token
+        for token in CIF_TOKEN.findall(line)
+    ]
+
+
+def _atom_site_rows(lines) -> Iterator[List[str]]:
+    """
+    Yields the column names of the atom_site loop and then its rows, as
+    lists of values.
+    """
+    columns = []
+    for line in lines:
+        if line.startswith("_atom_site."):
+            columns.append(line.strip()[len("_atom_site.") :])
+        elif columns:
+            break
+    else:
+        return
+    yield columns
+
+    values = []
+    while line is not None and not line.startswith(("#", "loop_", "_", "data_")):
+        # Rows can be split over several lines
+        values += _cif_tokens(line)
+        if len(values) >= len(columns):
+            yield values[: len(columns)]
+            values = values[len(columns) :]
+        line = next(lines, None)
+
+
+def mmcif_parser(
+    file,
+    chains: Collection[str] = None,
+    residues: Collection = None,
+    altloc: str or None = "A",
+    model: int = 1,
+    hetero_atoms: bool = True,
+) -> MoleculeArrays:
+    """
+    Parses an mmCIF (.cif) file into MoleculeArrays. Atoms are selected
+    while the file is read, with the same options as pdb_parser. Chains
+    and residue numbers are the ones given by the authors, like in .pdb
+    files.
+
+    mmCIF files don't list the bonds inside residues, so the molecule has
+    no bonds.
+
+    file can be a path or an open text file.
+    """
+    selection = _AtomSelection(chains, residues, altloc)
+    name = ""
+
+    with _open_text(file) as cif_file:
+        lines = iter(cif_file)
+        for line in lines:
+            if line.startswith("data_"):
+                name = line[5:].strip()
+                break
+
+        rows = _atom_site_rows(lines)
+        columns = next(rows, None)
+        if columns is None:
+            return selection.molecule([], name)
+
+        def column(*names):
+            return next((columns.index(name) for name in names if name in columns), None)
+
+        group = column("group_PDB")
+        serial = column("id")
+        element = column("type_symbol")
+        atom_name = column("auth_atom_id", "label_atom_id")
+        alt_id = column("label_alt_id")
+        residue_name = column("auth_comp_id", "label_comp_id")
+        chain = column("auth_asym_id", "label_asym_id")
+        residue_number = column("auth_seq_id", "label_seq_id")
+        model_number = column("pdbx_PDB_model_num")
+        x, y, z = column("Cartn_x"), column("Cartn_y"), column("Cartn_z")
+
+        def value(row, index):
+            if index is None or row[index] in CIF_EMPTY:
+                return ""
+            return row[index]
+
+        for row in rows:
+            if model_number is not None and _int_or_none(row[model_number]) != model:
+                continue
+            if not hetero_atoms and value(row, group) == "HETATM":
+                continue
+            if not selection.accepts(
+                value(row, chain),
+                value(row, residue_name),
+                _int_or_none(value(row, residue_number)),
+                value(row, alt_id),
+            ):
+                continue
+            selection.add(
+                _int_or_none(value(row, serial)),
+                (float(row[x]), float(row[y]), float(row[z])),
+                _element_symbol(value(row, element), " " + value(row, atom_name)),
+            )
+
+    return selection.molecule([], name)
@@ -0,0 +1,237 @@
+from collections import deque
+from typing import List, Tuple
+
+import numpy as np
+
+
+def _neighbours(bond_from, bond_to, number_of_atoms):
+    """
+    Returns the (neighbour, bond) pairs of every atom. Repeated bonds and
+    bonds of an atom with itself are left out.
+    """
+    neighbours = [[] for _ in range(number_of_atoms)]
+    seen = set()
+    for bond, (from_atom, to_atom) in enumerate(zip(bond_from, bond_to)):
+        pair = (min(from_atom, to_atom), max(from_atom, to_atom))
+        if from_atom == to_atom or pair in seen:
+            continue
+        seen.add(pair)
+        neighbours[from_atom].append((to_atom, bond))
+        neighbours[to_atom].append((from_atom, bond))
+
+    return neighbours
+
+
+def _ring_bonds(neighbours, number_of_bonds):
+    """
+    Returns which bonds are in some ring, that is, every bond but the
+    bridges, found with a depth-first search.
+    """
+    in_ring = np.zeros(number_of_bonds, dtype=bool)
+    order = [-1] * len(neighbours)
+    low = [0] * len(neighbours)
+    counter = 0
+    for root in range(len(neighbours)):
+        if order[root] != -1 or not neighbours[root]:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack = [(root, -1, iter(neighbours[root]))]
+        while stack:
+            atom, parent_bond, bonds = stack[-1]
+            for neighbour, bond in bonds:
+                if bond == parent_bond:
+                    continue
+                if order[neighbour] == -1:
+                    order[neighbour] = low[neighbour] = counter
+                    counter += 1
+                    stack.append((neighbour, bond, iter(neighbours[neighbour])))
+                    break
+                low[atom] = min(low[atom], order[neighbour])
+                in_ring[bond] = True
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    low[parent] = min(low[parent], low[atom])
+                    in_ring[parent_bond] = low[atom] <= order[parent]
+
+    return in_ring
+
+
+def _search(neighbours, in_ring, root, max_depth):
+    """
+    Breadth-first search from root through the bonds in rings, up to
+    max_depth bonds away. Returns the parent (atom and bond), the depth and
+    the branch (the neighbour of root it was reached through) of every
+    visited atom.
+    """
+    parents = {root: (None, None)}
+    depths = {root: 0}
+    branches = {root: None}
+    queue = deque([root])
+    while queue:
+        atom = queue.popleft()
+        if depths[atom] == max_depth:
+            continue
+        for neighbour, bond in neighbours[atom]:
+            if in_ring[bond] and neighbour not in parents:
+                parents[neighbour] = (atom, bond)
+                depths[neighbour] = depths[atom] + 1
+                branches[neighbour] = branches[atom] if atom != root else neighbour
+                queue.append(neighbour)
+
+    return parents, depths, branches
+
+
+def _candidate_rings(neighbours, in_ring, atoms, depth):
+    """
+    Yields the atoms, in ring order, and the bonds of Horton's candidate
+    rings of 2 * depth or 2 * depth + 1 atoms: the rings made by a bond
+    between atoms visited by a search from an atom of the ring system that
+    is not part of its tree, with the paths of both atoms to the root.
+
+    Every ring of a smallest set of smallest rings is one of them, for the
+    search from any of its atoms, so taking them from the smallest while
+    they are independent gives a smallest set.
+    """
+
+    def path(parents, atom):
+        atoms, bonds = [atom], []
+        while parents[atoms[-1]][0] is not None:
+            parent, parent_bond = parents[atoms[-1]]
+            atoms.append(parent)
+            bonds.append(parent_bond)
+        return atoms, bonds
+
+    for root in atoms:
+        parents, depths, branches = _search(neighbours, in_ring, root, depth)
+        tree_bonds = {bond for _, bond in parents.values()}
+        for atom in parents:
+            for neighbour, bond in neighbours[atom]:
+                if (
+                    atom > neighbour
+                    or neighbour not in parents
+                    or depths[atom] + depths[neighbour] + 1 < 2 * depth
+                    or bond in tree_bonds
+                    or not in_ring[bond]
+                    # Paths that meet before the root don't make a ring
+                    or branches[atom] == branches[neighbour]
+                ):
+                    continue
+                atom_path, atom_bonds = path(parents, atom)
+                neighbour_path, neighbour_bonds = path(parents, neighbour)
+                yield (
+                    atom_path[::-1] + neighbour_path[:-1],
+                    atom_bonds + neighbour_bonds + [bond],
+                )
+
+
+def _ring_systems(neighbours, in_ring):
+    """
+    Yields the atoms and the bonds of every group of rings that share atoms.
+    """
+    visited = set()
+    for root in range(len(neighbours)):
+        if root in visited or not any(in_ring[bond] for _, bond in neighbours[root]):
+            continue
+        visited.add(root)
+        atoms = [root]
+        bonds = set()
+        queue = deque([root])
+        while queue:
+            atom = queue.popleft()
+            for neighbour, bond in neighbours[atom]:
+                if not in_ring[bond]:
+                    continue
+                bonds.add(bond)
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    atoms.append(neighbour)
+                    queue.append(neighbour)
+
+        yield atoms, sorted(bonds)
+
+
+def _by_size(rings):
+    """
+    Returns the different rings as (set of bonds, atoms), smallest first.
+    """
+    different_rings = {}
+    for ring, ring_bonds in rings:
+        different_rings.setdefault(frozenset(ring_bonds), ring)
+
+    return sorted(different_rings.items(), key=lambda candidate: len(candidate[1]))
+
+
+class _RingBasis:
+    """
+    Independent rings, kept as sparse sets of bonds reduced by Gaussian
+    elimination. Bonds are ordered as they first appear, so a ring with a
+    bond that no ring of the basis has is independent right away. Only
+    rings made of bonds already seen are reduced.
+    """
+
+    def __init__(self):
+        self.order = {}
+        self.rows = {}
+
+    def add(self, ring_bonds) -> bool:
+        """
+        Adds the ring if it is independent of the rings of the basis.
+        Returns whether it was added.
+        """
+        for bond in ring_bonds:
+            self.order.setdefault(bond, len(self.order))
+        vector = set(ring_bonds)
+        while vector:
+            pivot = max(vector, key=self.order.__getitem__)
+            if pivot not in self.rows:
+                self.rows[pivot] = vector
+                return True
+            vector ^= self.rows[pivot]
+
+        return False
+
+
+def find_rings(bond_from, bond_to, number_of_atoms: int = None) -> List[Tuple[int]]:
+    """
+    Returns the smallest set of smallest rings (SSSR) of a molecule, as
+    tuples of atom indices in ring order, smallest rings first. Atoms are
+    the values used in bond_from and bond_to.
+
+    Rings are taken from Horton's candidates, smallest first, while they
+    are independent of the ones already taken, until there are as many as
+    the ring system has (bonds minus atoms plus one). Candidates are
+    generated by size: the searches from every atom go one bond deeper
+    each time, and stop as soon as there are enough rings. Molecules made
+    of small rings, however many, take about linear time. Ring systems
+    with big rings need deep searches from every atom, which take up to
+    quadratic time.
+    """
+    bond_from = np.asarray(bond_from, dtype=np.int64).tolist()
+    bond_to = np.asarray(bond_to, dtype=np.int64).tolist()
+    if number_of_atoms is None:
+        number_of_atoms = max(bond_from + bond_to, default=-1) + 1
+
+    neighbours = _neighbours(bond_from, bond_to, number_of_atoms)
+    in_ring = _ring_bonds(neighbours, len(bond_from))
+
+    rings = []
+    for atoms, bonds in _ring_systems(neighbours, in_ring):
+        number_of_rings = len(bonds) - len(atoms) + 1
+        basis = _RingBasis()
+        found = []
+        depth = 1
+        while len(found) < number_of_rings:
+            candidates = _candidate_rings(neighbours, in_ring, atoms, depth)
+            for ring_bonds, ring in _by_size(candidates):
+                if basis.add(ring_bonds):
+                    found.append(tuple(ring))
+                    if len(found) == number_of_rings:
+                        break
+            depth += 1
+
+        rings += found
+
+    return sorted(rings, key=len)
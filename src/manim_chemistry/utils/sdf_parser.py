@@ -0,0 +1,101 @@
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+from .molecule_arrays import MoleculeArrays
+from .utils import mol_block_array_parser
+
+DATA_HEADER = re.compile(r"<([^>]*)>")
+
+
+class SDFRecord(NamedTuple):
+    """
+    A molecule of an SDF file:
+        - name: first line of its MOL block.
+        - molecule: the molecule as MoleculeArrays.
+        - data: data fields of the record, by field name.
+
+    atoms and bonds give the same dicts as mol_parser returns.
+    """
+
+    name: str
+    molecule: MoleculeArrays
+    data: Dict[str, str]
+
+    @property
+    def atoms(self) -> Dict[int, Dict[str, Any]]:
+        return self.molecule.atoms_dict
+
+    @property
+    def bonds(self) -> Dict[int, List[Dict[str, Any]]]:
+        return self.molecule.bonds_dict
+
+
+def parse_sdf_data(lines: List[str]) -> Dict[str, str]:
+    """
+    Parses the data items after the MOL block of an SDF record:
+
+        >  <FIELD_NAME>
+        value lines
+        (blank line)
+    """
+    data = {}
+    field_name = None
+    value_lines = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.startswith(">"):
+            header = DATA_HEADER.search(line)
+            field_name = header.group(1) if header else line[1:].strip()
+            value_lines = []
+
+        elif field_name is not None:
+            if line.strip():
+                value_lines.append(line)
+            else:
+                data[field_name] = "\n".join(value_lines)
+                field_name = None
+
+    if field_name is not None:
+        data[field_name] = "\n".join(value_lines)
+
+    return data
+
+
+def parse_sdf_record(lines: List[str]) -> SDFRecord:
+    end_index = next(
+        (index for index, line in enumerate(lines) if line.startswith("M  END")),
+        len(lines),
+    )
+    molecule = mol_block_array_parser(lines[:end_index])
+    molecule.data = parse_sdf_data(lines[end_index + 1 :])
+
+    return SDFRecord(name=molecule.name, molecule=molecule, data=molecule.data)
+
+
+def sdf_parser(file) -> Iterator[SDFRecord]:
+    """
+    Yields the molecules of an SDF file one by one as SDFRecords. Only the
+    record being parsed is kept in memory, so files of any size can be read.
+
+    file can be a path or an open text file (for example gzip.open(path, "rt")).
+    """
+    if hasattr(file, "read"):
+        yield from _sdf_records(file)
+        return
+
+    with open(file) as sdf_file:
+        yield from _sdf_records(sdf_file)
+
+
+def _sdf_records(sdf_file) -> Iterator[SDFRecord]:
+    record_lines = []
+    for line in sdf_file:
+        if line.startswith("$$$$"):
+            if any(record_line.strip() for record_line in record_lines):
+                yield parse_sdf_record(record_lines)
+            record_lines = []
+        else:
+            record_lines.append(line)
+
+    if any(record_line.strip() for record_line in record_lines):
+        yield parse_sdf_record(record_lines)
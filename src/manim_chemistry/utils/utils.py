@@ -1,108 +1,433 @@
+import itertools
+import re
+import warnings
+
 import numpy as np
-from typing import Dict, Any
 
-from ..element import Element
+from ..element import get_element_table
+from ..instrumentation import profiled_stage
+from .molecule_arrays import MoleculeArrays, MISSING
 
 
 def get_symbol_to_atomic_number(element_file_path):
-    available_atomic_numbers = list(range(1, 119))
-    available_elements = [Element.from_csv_file(element_file_path, i)
-                          for i in available_atomic_numbers]
-    symbol_to_atomic_number = {element.symbol.lower(
-    ): element.atomic_number for element in available_elements}
-    return symbol_to_atomic_number
+    return get_element_table(element_file_path).symbol_to_atomic_number()
 
 
 def mol_parser(file):
-    with open(file) as file:
-        mol_file = file.readlines()
-    # Get general data
+    """
+    Parses a .mol file. Returns a dict of atoms and a dict of bonds grouped
+    by their first atom. Use mol_array_parser to get them as arrays.
+    """
+    molecule = mol_array_parser(file)
+    return molecule.atoms_dict, molecule.bonds_dict
+
+
+def mol_array_parser(file) -> MoleculeArrays:
+    """
+    Parses a .mol file into MoleculeArrays.
+    """
+    with profiled_stage("mol_parser"):
+        with open(file) as file:
+            header = [file.readline() for _ in range(4)]
+            if is_v3000(header):
+                # V3000 blocks are parsed while the file is read
+                return v3000_block_array_parser(itertools.chain(header, file))
+            return mol_block_array_parser(header + file.readlines())
+
+
+def mol_block_parser(mol_file):
+    """
+    Parses the lines of a MOL block, from its header to its bond block.
+    Returns the same atoms and bonds dicts as mol_parser.
+    """
+    molecule = mol_block_array_parser(mol_file)
+    return molecule.atoms_dict, molecule.bonds_dict
+
+
+def mol_block_array_parser(mol_file) -> MoleculeArrays:
+    """
+    Parses the lines of a MOL block into MoleculeArrays. Both V2000 and
+    V3000 blocks are supported.
+    """
+    if is_v3000(mol_file):
+        return v3000_block_array_parser(mol_file)
 
     mol_name = mol_file[0].strip()  # This info is not always available
-    mol_source = mol_file[1].strip()  # This info is not always available
-    mol_comments = mol_file[2].rstrip()  # This info is not always available
-    mol_general_info = mol_file[3]  # This info is not always available
-    mol_file.remove(mol_general_info)  # This info is not always available
-    mol_general_info = (
-        mol_general_info.rstrip().split()
-    )  # This info is not always available
-    number_of_atoms = int(mol_general_info[0])
-    number_of_bonds = int(mol_general_info[1])
-
-    atoms = {}
-    bonds = {}
-    for index, line in enumerate(mol_file[3: 3 + number_of_atoms]):
-        line_data = line.split()
-        x_position = float(line_data[0])
-        y_position = float(line_data[1])
-        z_position = float(line_data[2])
-        element = line_data[3]
-        atoms[index + 1] = {
-            "coords": np.array([x_position, y_position, z_position]),
-            "element": element,
-        }
-
-    for line in mol_file[3 + number_of_atoms: 3 + number_of_atoms + number_of_bonds]:
-        line_data = line.split()
-        first_atom_index = int(float(line_data[0]))
-        second_atom_index = int(float(line_data[1]))
-        bond_type = line_data[2]
-        bond_data = {
-            "to": second_atom_index,
-            "type": bond_type,
-            # "stereo": bond_stereo,
-            # "topology": bond_topology,
-            # "reacting_center_status": reacting_center_status
-        }
+    number_of_atoms, number_of_bonds = parse_counts_line(mol_file[3])
+    atom_lines = mol_file[4 : 4 + number_of_atoms]
+    bond_lines = mol_file[4 + number_of_atoms : 4 + number_of_atoms + number_of_bonds]
+
+    coords, elements = parse_atom_block(atom_lines)
+    bond_fields = parse_bond_block(bond_lines)
+
+    return MoleculeArrays(
+        coords=coords,
+        elements=elements,
+        bond_from=bond_fields[:, 0],
+        bond_to=bond_fields[:, 1],
+        bond_types=bond_fields[:, 2],
+        bond_stereo=bond_fields[:, 3],
+        bond_topology=bond_fields[:, 4],
+        bond_reacting_center=bond_fields[:, 5],
+        name=mol_name,
+    )
+
+
+def parse_counts_line(line):
+    """
+    Returns the number of atoms and bonds of a V2000 counts line. Both are
+    3 characters wide, so they are glued together when the number of atoms
+    is above 99.
+    """
+    mol_general_info = line.split()
+    if len(mol_general_info[0]) > 3 and line[0:6].lstrip() == mol_general_info[0]:
+        return int(line[0:3]), int(line[3:6])
+
+    return int(mol_general_info[0]), int(mol_general_info[1])
+
+
+# V2000 column ranges of the atom coordinates and symbol.
+ATOM_COORD_COLUMNS = (0, 30)
+ATOM_SYMBOL_COLUMNS = (31, 34)
+# V2000 columns of the bond fields that are parsed, all 3 characters wide:
+# first atom, second atom, type, stereo, topology and reacting center status.
+BOND_COLUMNS = np.r_[0:12, 15:21]
+BOND_FIELD_WIDTH = 3
+# Positions of the same fields when a bond line is split into tokens.
+BOND_TOKENS = (0, 1, 2, 3, 5, 6)
+
+
+def line_matrix(lines, width=0):
+    """
+    Returns the lines as a (number of lines, length) uint8 array padded with
+    NUL bytes, so the same columns of every line can be sliced at once.
+    Returns None if the lines aren't ASCII.
+    """
+    try:
+        block = np.array(lines, dtype=bytes)
+    except UnicodeEncodeError:
+        return None
+    if block.dtype.itemsize < width:
+        block = block.astype(f"S{width}")
+
+    return block.view(np.uint8).reshape(len(block), -1)
+
 
+def fixed_width_field(characters, start, end):
+    """
+    Returns the characters of every line between start and end as a bytes
+    array.
+    """
+    return np.ascontiguousarray(characters[:, start:end]).view(f"S{end - start}")
+
+
+def split_tokens(characters):
+    """
+    Splits every line into whitespace separated tokens at once. Returns the
+    number of tokens of each line and the text of all the lines with their
+    tokens separated by spaces, ready to be split in a single call.
+    """
+    filled = characters > ord(" ")  # Neither whitespace nor padding
+    token_starts = filled.copy()
+    token_starts[:, 1:] &= ~filled[:, :-1]
+
+    # Every line gets a separator at its end so tokens don't run into the
+    # next line.
+    text = np.full((len(characters), characters.shape[1] + 1), ord(" "), np.uint8)
+    text[:, :-1][filled] = characters[filled]
+
+    return token_starts.sum(axis=1), text.tobytes()
+
+
+def select_tokens(tokens, counts, positions, missing):
+    """
+    Returns a (number of lines, len(positions)) array with the tokens each
+    line has at the given positions, or missing where a line has fewer.
+    """
+    offsets = np.cumsum(counts) - counts
+    fields = np.full((len(counts), len(positions)), missing, dtype=tokens.dtype)
+    for column, position in enumerate(positions):
+        has_token = counts > position
+        fields[has_token, column] = tokens[offsets[has_token] + position]
+
+    return fields
+
+
+def parse_integers(text, expected):
+    """
+    Parses space separated integers in a single call. Returns None if there
+    is anything else in the text.
+    """
+    with warnings.catch_warnings():
+        # numpy warns instead of failing when it finds something that isn't
+        # a number.
+        warnings.simplefilter("error", DeprecationWarning)
         try:
-            bond_stereo = line_data[3]
-        except:
-            bond_stereo = ""
-        else:
-            bond_data["stereo"] = int(bond_stereo)
+            values = np.fromstring(text, dtype=np.int64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            return None
+
+    return values if len(values) == expected else None
 
+
+def parse_atom_block(atom_lines):
+    """
+    Parses the coordinates and element symbols of an atom block. Lines are
+    read by their V2000 columns, or split into tokens if they don't follow
+    them.
+    """
+    if not atom_lines:
+        return np.empty((0, 3)), []
+
+    characters = line_matrix(atom_lines, ATOM_SYMBOL_COLUMNS[1])
+    if characters is None:
+        return parse_atom_tokens(atom_lines)
+
+    if np.all(characters[:, ATOM_SYMBOL_COLUMNS[0]] > ord(" ")):
         try:
-            bond_topology = line_data[5]
-        except:
-            bond_topology = ""
-        else:
-            bond_data["topology"] = int(bond_topology)
+            coords = (
+                fixed_width_field(characters, *ATOM_COORD_COLUMNS)
+                .view("S10")
+                .reshape(-1, 3)
+                .astype(np.float64)
+            )
+            symbols = np.char.rstrip(fixed_width_field(characters, *ATOM_SYMBOL_COLUMNS))
+            return coords, symbols.reshape(-1).astype(str)
+        except ValueError:
+            pass
+
+    counts, text = split_tokens(characters)
+    if np.any(counts < 4):
+        return parse_atom_tokens(atom_lines)
+    fields = select_tokens(np.array(text.split()), counts, (0, 1, 2, 3), b"")
+
+    return fields[:, :3].astype(np.float64), fields[:, 3].astype(str)
 
+
+def parse_bond_block(bond_lines):
+    """
+    Parses a bond block into a (number of bonds, 6) int array with the first
+    atom, second atom, type, stereo, topology and reacting center status of
+    each bond. Atoms are numbered from 0 and missing optional fields are
+    MISSING. Lines are read by their V2000 columns, which also works when
+    atom numbers above 99 are glued together, or split into tokens if they
+    don't follow them.
+    """
+    if not bond_lines:
+        return np.empty((0, 6), dtype=np.int64)
+
+    characters = line_matrix(bond_lines, BOND_COLUMNS[-1] + 1)
+    if characters is None:
+        return parse_bond_tokens(bond_lines)
+
+    fields = np.ascontiguousarray(characters[:, BOND_COLUMNS])
+    present = np.any(
+        fields.reshape(len(fields), -1, BOND_FIELD_WIDTH) > ord(" "), axis=2
+    )
+    if np.all(present[:, :3]):
         try:
-            reacting_center_status = line_data[6]
-        except:
-            reacting_center_status = ""
-        else:
-            bond_data["reacting_center_status"] = int(reacting_center_status)
-
-        if first_atom_index not in bonds:
-            bonds[first_atom_index] = [bond_data]
-            if not atoms.get(first_atom_index) or not atoms.get(first_atom_index).get(
-                "bond_to"
-            ):
-                atoms[first_atom_index]["bond_to"] = {
-                    second_atom_index: atoms.get(
-                        second_atom_index).get("element")
-                }
-            else:
-                atoms[first_atom_index]["bond_to"][second_atom_index] = atoms.get(
-                    second_atom_index
-                ).get("element")
-
-        else:
-            bonds[first_atom_index].append(bond_data)
-            atoms[first_atom_index]["bond_to"][second_atom_index] = atoms.get(
-                second_atom_index
-            ).get("element")
-
-        if not atoms.get(second_atom_index).get("bond_to"):
-            atoms[second_atom_index]["bond_to"] = {
-                first_atom_index: atoms.get(first_atom_index).get("element")
-            }
-        else:
-            atoms[second_atom_index]["bond_to"][first_atom_index] = atoms.get(
-                first_atom_index
-            ).get("element")
-
-    return atoms, bonds  # Should return atoms and bonds
+            bond_fields = np.where(
+                present, fields.view(f"S{BOND_FIELD_WIDTH}"), str(MISSING).encode()
+            ).astype(np.int64)
+            bond_fields[:, :2] -= 1
+            return bond_fields
+        except ValueError:
+            pass
+
+    counts, text = split_tokens(characters)
+    tokens = parse_integers(text, counts.sum())
+    if tokens is None or np.any(counts < 3):
+        return parse_bond_tokens(bond_lines)
+
+    # stereo, topology and reacting center status are optional
+    bond_fields = select_tokens(tokens, counts, BOND_TOKENS, MISSING)
+    bond_fields[:, :2] -= 1
+
+    return bond_fields
+
+
+def parse_atom_tokens(atom_lines):
+    coords = []
+    elements = []
+    for line in atom_lines:
+        line_data = line.split()
+        coords.append(
+            (float(line_data[0]), float(line_data[1]), float(line_data[2]))
+        )
+        elements.append(line_data[3])
+
+    return np.array(coords, dtype=np.float64).reshape(-1, 3), elements
+
+
+def parse_bond_tokens(bond_lines):
+    bond_fields = []
+    for line in bond_lines:
+        line_data = line.split()
+        bond_fields.append(
+            (
+                int(float(line_data[0])) - 1,
+                int(float(line_data[1])) - 1,
+                int(line_data[2]),
+                # stereo, topology and reacting center status are optional
+                int(line_data[3]) if len(line_data) > 3 else MISSING,
+                int(line_data[5]) if len(line_data) > 5 else MISSING,
+                int(line_data[6]) if len(line_data) > 6 else MISSING,
+            )
+        )
+
+    return np.array(bond_fields, dtype=np.int64).reshape(-1, 6)
+
+
+# Prefix of the lines of a V3000 connection table. Its two tokens come
+# before the fields of every atom and bond line.
+V3000_PREFIX = "M  V30 "
+V3000_CONTINUATION = re.compile(r"-[ \t]*\r?\nM  V30 ")
+# V2000 stereo values of the V3000 bond configurations (CFG=1, 2 and 3)
+V3000_BOND_STEREO = {1: 1, 2: 4, 3: 6}
+
+
+def is_v3000(mol_file):
+    return len(mol_file) > 3 and "V3000" in mol_file[3]
+
+
+def v3000_block_array_parser(mol_file) -> MoleculeArrays:
+    """
+    Parses a V3000 MOL block into MoleculeArrays. V3000 has no limit on the
+    number of atoms and bonds.
+
+    mol_file can be any iterable of lines, like an open file. Lines are read
+    once, up to the end of the connection table, and only the atom and bond
+    blocks are kept.
+    """
+    lines = iter(mol_file)
+    header = list(itertools.islice(lines, 4))
+    mol_name = header[0].strip() if header else ""
+
+    blocks = {"ATOM": [], "BOND": []}
+    for line in lines:
+        if line.startswith("M  END"):
+            break
+        if not line.startswith(V3000_PREFIX):
+            continue
+
+        words = line.split()
+        if words[2:4] == ["END", "CTAB"]:
+            break
+        if words[2:3] == ["BEGIN"] and words[3:4] in (["ATOM"], ["BOND"]):
+            block = []
+            for line in lines:
+                if line.startswith(V3000_PREFIX + "END"):
+                    break
+                block.append(line)
+            blocks[words[3]] = join_v3000_lines(block)
+
+    atom_ids, coords, elements = parse_v3000_atoms(blocks["ATOM"])
+    bond_fields = parse_v3000_bonds(blocks["BOND"])
+
+    bond_atoms = bond_fields[:, :2]
+    if np.array_equal(atom_ids, np.arange(1, len(atom_ids) + 1)):
+        bond_atoms = bond_atoms - 1
+    else:
+        # Atom ids don't need to be consecutive
+        sorter = np.argsort(atom_ids)
+        positions = np.searchsorted(atom_ids, bond_atoms, sorter=sorter)
+        positions = np.minimum(positions, max(len(atom_ids) - 1, 0))
+        bond_atoms = np.where(
+            atom_ids[sorter][positions] == bond_atoms, sorter[positions], -1
+        )
+
+    return MoleculeArrays(
+        coords=coords,
+        elements=elements,
+        bond_from=bond_atoms[:, 0],
+        bond_to=bond_atoms[:, 1],
+        bond_types=bond_fields[:, 2],
+        bond_stereo=bond_fields[:, 3],
+        bond_topology=bond_fields[:, 4],
+        bond_reacting_center=bond_fields[:, 5],
+        name=mol_name,
+    )
+
+
+def join_v3000_lines(block):
+    """
+    Joins the lines that end with - to the next one.
+    """
+    text = "".join(block)
+    if "-" not in text:
+        return block
+
+    return V3000_CONTINUATION.sub("", text).splitlines()
+
+
+def v3000_tokens(lines):
+    """
+    Splits V3000 lines into tokens. Returns the number of tokens of each
+    line and all the tokens as a bytes array.
+    """
+    characters = line_matrix(lines)
+    if characters is None:
+        tokens = [line.encode().split() for line in lines]
+        counts = np.array([len(line_tokens) for line_tokens in tokens])
+        return counts, np.array(list(itertools.chain.from_iterable(tokens)))
+
+    counts, text = split_tokens(characters)
+    return counts, np.array(text.split())
+
+
+def parse_v3000_atoms(atom_lines):
+    """
+    Parses the atom lines of a V3000 connection table:
+
+        M  V30 index type x y z aamap [properties]
+
+    Returns the atom ids, coordinates and element symbols.
+    """
+    if not atom_lines:
+        return np.empty(0, dtype=np.int64), np.empty((0, 3)), []
+
+    counts, tokens = v3000_tokens(atom_lines)
+    if np.any(counts < 7):
+        raise Exception("V3000 atom lines need an index, a type and 3 coordinates")
+    fields = select_tokens(tokens, counts, (2, 3, 4, 5, 6), b"")
+
+    return (
+        fields[:, 0].astype(np.int64),
+        fields[:, 2:5].astype(np.float64),
+        np.char.decode(fields[:, 1]),
+    )
+
+
+def parse_v3000_bonds(bond_lines):
+    """
+    Parses the bond lines of a V3000 connection table:
+
+        M  V30 index type atom1 atom2 [properties]
+
+    Returns the same fields as parse_bond_block, with atom ids instead of
+    atom numbers. CFG is turned into its V2000 stereo value and TOPO and
+    RXCTR are the topology and reacting center status.
+    """
+    bond_fields = np.full((len(bond_lines), 6), MISSING, dtype=np.int64)
+    if not bond_lines:
+        return bond_fields
+
+    counts, tokens = v3000_tokens(bond_lines)
+    if np.any(counts < 6):
+        raise Exception("V3000 bond lines need an index, a type and 2 atoms")
+    bond_fields[:, :3] = select_tokens(tokens, counts, (4, 5, 3), b"").astype(np.int64)
+    bond_fields[:, 3] = 0
+
+    # Properties are KEY=VALUE tokens after the atoms
+    offsets = np.cumsum(counts) - counts
+    for bond in np.flatnonzero(counts > 6).tolist():
+        for token in tokens[offsets[bond] + 6 : offsets[bond] + counts[bond]].tolist():
+            key, _, value = token.partition(b"=")
+            if key == b"CFG":
+                bond_fields[bond, 3] = V3000_BOND_STEREO.get(int(value), 0)
+            elif key == b"TOPO":
+                bond_fields[bond, 4] = int(value)
+            elif key == b"RXCTR":
+                bond_fields[bond, 5] = int(value)
+
+    return bond_fields
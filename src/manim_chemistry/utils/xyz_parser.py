@@ -0,0 +1,38 @@
+from .molecule_arrays import MoleculeArrays
+from .pdb_parser import _open_text
+
+
+def xyz_parser(file) -> MoleculeArrays:
+    """
+    Parses the first molecule of an .xyz file into MoleculeArrays:
+
+        number of atoms
+        comment, used as the name
+        element x y z
+        ...
+
+    .xyz files have no bonds; use perceive_bonds to find them.
+
+    file can be a path or an open text file.
+    """
+    with _open_text(file) as xyz_file:
+        number_of_atoms = int(xyz_file.readline())
+        name = xyz_file.readline().strip()
+
+        coords = []
+        elements = []
+        for _ in range(number_of_atoms):
+            line_data = xyz_file.readline().split()
+            coords.append(
+                (float(line_data[1]), float(line_data[2]), float(line_data[3]))
+            )
+            elements.append(line_data[0].capitalize())
+
+    return MoleculeArrays(
+        coords=coords,
+        elements=elements,
+        bond_from=[],
+        bond_to=[],
+        bond_types=[],
+        name=name,
+    )
@@ -0,0 +1,16 @@
+import pytest
+from manim_chemistry.element import clear_element_tables
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """
+    Keeps the caches written by every test in its temporary directory, so
+    the suite never touches the user's cache, and starts without loaded
+    element tables.
+    """
+    monkeypatch.setenv("MANIM_CHEMISTRY_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("MANIM_CHEMISTRY_NO_CACHE", raising=False)
+    clear_element_tables()
+    yield tmp_path / "cache"
+    clear_element_tables()
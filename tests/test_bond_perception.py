@@ -0,0 +1,38 @@
+import numpy as np
+from manim_chemistry import MoleculeArrays, mol_array_parser, perceive_bonds, xyz_parser
+
+elements_path = "assets/Elements_EN.csv"
+
+
+def bond_set(molecule):
+    return set(
+        zip(
+            np.minimum(molecule.bond_from, molecule.bond_to).tolist(),
+            np.maximum(molecule.bond_from, molecule.bond_to).tolist(),
+        )
+    )
+
+
+def test_perceived_bonds_match_mol_file():
+    molecule = mol_array_parser("examples/element_files/morphine3d.mol")
+    perceived = perceive_bonds(molecule, elements_path)
+
+    # Every bond was already in the file, so nothing is added
+    assert perceived.number_of_bonds == molecule.number_of_bonds
+    np.testing.assert_equal(perceived.bond_types, molecule.bond_types)
+
+    without_bonds = MoleculeArrays(molecule.coords, molecule.elements, [], [], [])
+    assert bond_set(perceive_bonds(without_bonds, elements_path)) == bond_set(molecule)
+
+
+def test_xyz_parser(tmp_path):
+    xyz_path = tmp_path / "water.xyz"
+    xyz_path.write_text(
+        "3\nwater\nO 0.0 0.0 0.117\nH 0.0 0.757 -0.467\nH 0.0 -0.757 -0.467\n"
+    )
+
+    molecule = perceive_bonds(xyz_parser(xyz_path), elements_path)
+    assert molecule.name == "water"
+    assert molecule.elements.tolist() == ["O", "H", "H"]
+    assert bond_set(molecule) == {(0, 1), (0, 2)}
+    assert molecule.bonds_dict == {1: [{"to": 2, "type": "1"}, {"to": 3, "type": "1"}]}
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from manim_chemistry import Element, get_element_table
+from manim_chemistry.element.element_table import compiled_table_path, load_element_table
+
+
+@pytest.fixture
+def elements_path():
+    return "assets/Elements_EN.csv"
+
+
+def test_element_table_is_loaded_once(elements_path):
+    assert get_element_table(elements_path) is get_element_table(elements_path)
+
+
+def test_element_lookup(elements_path):
+    iron = Element.from_csv_file(elements_path, "Fe")
+
+    assert iron.atomic_number == 26
+    assert iron is Element.from_csv_file(elements_path, 26)
+
+
+def test_element_colors_are_kept():
+    named = Element("X", "X", 6, 12.0, "red")
+    assert named.color == "red"
+    assert named.rgb.shape == (3,)
+
+    short = Element("X", "X", 6, 12.0, "#fff")
+    assert short.color == "#fff"
+    np.testing.assert_allclose(short.rgb, [1.0, 1.0, 1.0])
+
+
+def test_invalid_element_reference(elements_path):
+    with pytest.raises(Exception):
+        Element.from_csv_file(elements_path, "Xx")
+
+    with pytest.raises(Exception):
+        Element.from_csv_file(elements_path, 119)
+
+
+def test_vectorized_lookups(elements_path):
+    table = get_element_table(elements_path)
+    symbols = np.array(["C", "H", "H", "O"])
+
+    np.testing.assert_allclose(
+        table.masses_for(symbols), table.masses_for([6, 1, 1, 8])
+    )
+    np.testing.assert_allclose(table.colors_for(["H"]), [[1.0, 1.0, 1.0]])
+    assert table.molecular_mass(symbols) == pytest.approx(30.024)
+
+
+def test_compiled_table_is_rebuilt_when_csv_changes(elements_path, tmp_path):
+    csv_path = tmp_path / "elements.csv"
+    csv_path.write_text(open(elements_path, encoding="utf-8").read())
+
+    assert load_element_table(csv_path).get(26).name == "Iron"
+    assert compiled_table_path(csv_path).exists()
+
+    csv_path.write_text(csv_path.read_text().replace("Iron", "Ferrum"))
+    assert load_element_table(csv_path).get(26).name == "Ferrum"
+
+
+def test_covalent_radii(elements_path, tmp_path):
+    table = get_element_table(elements_path)
+    np.testing.assert_allclose(table.covalent_radii_for(["H", "C", "Fe"]), [0.31, 0.76, 1.32])
+
+    csv_path = tmp_path / "elements.csv"
+    csv_path.write_text(
+        "AtomicNumber,Name,Symbol,AtomicMass,Color,CovalentRadius\n"
+        "1,Hydrogen,H,1.007,#ffffff,0.32\n"
+        "6,Carbon,C,12.011,#909090,\n"
+    )
+    assert get_element_table(csv_path).covalent_radii.tolist() == [0.32, 0.76]
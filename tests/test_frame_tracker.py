@@ -0,0 +1,16 @@
+import numpy as np
+from manim_chemistry.utils.frame_tracker import frame_tracker_points, frame_transform
+
+
+def test_frame_transform():
+    points = frame_tracker_points()
+    matrix, origin = frame_transform(points)
+    np.testing.assert_allclose(matrix, np.identity(3))
+    np.testing.assert_allclose(origin, 0, atol=1e-12)
+
+    # Scaled by 2, mirrored across y = -x and shifted
+    transformation = np.array([[0, -2, 0], [-2, 0, 0], [0, 0, 2]])
+    shift = np.array([-3.0, 1.0, 0.5])
+    matrix, origin = frame_transform(points @ transformation.T + shift)
+    np.testing.assert_allclose(matrix, transformation)
+    np.testing.assert_allclose(origin, shift)
@@ -0,0 +1,112 @@
+import ast
+import os
+import subprocess
+import sys
+
+# Seconds that `import manim_chemistry` may take on top of `import manim`.
+# Can be tightened or relaxed per machine with MANIM_CHEMISTRY_IMPORT_BUDGET.
+IMPORT_TIME_BUDGET = float(os.environ.get("MANIM_CHEMISTRY_IMPORT_BUDGET", "1.0"))
+
+IMPORT_TIME_SCRIPT = """
+import sys
+import time
+
+import manim
+
+start = time.perf_counter()
+import manim_chemistry
+print(time.perf_counter() - start)
+print("pandas" in sys.modules)
+"""
+
+
+def test_import_time_budget():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_TIME_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_time, pandas_imported = result.stdout.split()
+
+    assert pandas_imported == "False"
+    assert float(import_time) < IMPORT_TIME_BUDGET
+
+
+# Subpackages whose public names were all importable from manim_chemistry
+# before it imported them lazily.
+STAR_IMPORTED_SUBPACKAGES = (
+    "element",
+    "periodic_table",
+    "threeD",
+    "twoD",
+    "orbitals",
+    "bohr_atom",
+    "utils",
+    "chemical_text",
+)
+
+
+def test_subpackage_names_are_exported():
+    tree = ast.parse(open("src/manim_chemistry/__init__.py").read())
+    lazy_exports = ast.literal_eval(
+        next(
+            node.value
+            for node in tree.body
+            if isinstance(node, ast.Assign) and node.targets[0].id == "_lazy_exports"
+        )
+    )
+
+    for subpackage in STAR_IMPORTED_SUBPACKAGES:
+        init = ast.parse(open(f"src/manim_chemistry/{subpackage}/__init__.py").read())
+        for node in init.body:
+            if isinstance(node, ast.ImportFrom):
+                for alias in node.names:
+                    name = alias.asname or alias.name
+                    assert lazy_exports.get(name) == f".{subpackage}", name
+
+
+LAZY_IMPORT_SCRIPT = """
+import sys
+
+import manim
+
+already_imported = set(sys.modules)
+from manim_chemistry import MMoleculeObject
+print(" ".join(sorted(set(sys.modules) - already_imported)))
+"""
+
+
+def test_2d_molecules_do_not_import_other_subsystems():
+    result = subprocess.run(
+        [sys.executable, "-c", LAZY_IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = result.stdout.split()
+
+    for module in imported_modules:
+        assert not module.startswith(("scipy", "pandas"))
+        assert not module.startswith(
+            ("manim_chemistry.orbitals", "manim_chemistry.threeD")
+        )
+
+
+SUBPACKAGE_ATTRIBUTE_SCRIPT = """
+import manim_chemistry as mc
+
+print(mc.utils.mol_parser.__name__)
+print("utils" in dir(mc))
+"""
+
+
+def test_subpackages_are_attributes():
+    result = subprocess.run(
+        [sys.executable, "-c", SUBPACKAGE_ATTRIBUTE_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.split() == ["mol_parser", "True"]
@@ -0,0 +1,53 @@
+import logging
+from manim_chemistry import mol_parser, profile_build
+from manim_chemistry.instrumentation import instrumentation
+
+
+class Counted:
+    pass
+
+
+class CountedSubclass(Counted):
+    pass
+
+
+def test_profile_build_records_stages():
+    with profile_build() as profile:
+        mol_parser("examples/element_files/morphine.mol")
+        mol_parser("examples/element_files/dimethylpropane.mol")
+
+    stages = profile.as_dict()["stages"]
+    assert stages["mol_parser"]["calls"] == 2
+    assert stages["mol_parser"]["time"] > 0
+
+
+def test_stages_outside_profiles_are_not_recorded():
+    with profile_build() as profile:
+        pass
+    mol_parser("examples/element_files/morphine.mol")
+
+    assert profile.as_dict() == {"stages": {}, "counters": {}}
+
+
+def test_environment_profile_does_not_change_logging(monkeypatch, caplog):
+    monkeypatch.setenv("MANIM_CHEMISTRY_PROFILE", "1")
+    logger = instrumentation.logger
+    caplog.set_level(logging.INFO, logger=logger.name)
+    handlers, level = list(logger.handlers), logger.level
+
+    mol_parser("examples/element_files/morphine.mol")
+
+    assert logger.handlers == handlers and logger.level == level
+    assert '"build": "mol_parser"' in caplog.text
+
+
+def test_profile_build_counts_objects_of_the_class_only(monkeypatch):
+    monkeypatch.setattr(instrumentation, "COUNTED_CLASSES", {"Counted": __name__})
+    with profile_build() as profile:
+        Counted()
+        CountedSubclass()
+        CountedSubclass()
+    Counted()
+
+    assert profile.as_dict()["counters"] == {"Counted": 1}
+    assert "__init__" not in Counted.__dict__
@@ -0,0 +1,210 @@
+import numpy as np
+import pytest
+from manim import LEFT, ORIGIN, PI, MarkupText
+from manim_chemistry import MMoleculeObject, MAtomObject, BaseMBondObject, DoubleBond
+from manim_chemistry.twoD import labels
+from manim_chemistry.twoD.bond import PlainCramBond, PLAIN_CRAM_BOND, SIMPLE_BOND
+from manim_chemistry.twoD.molecule import FULL_DETAIL, SIMPLE_BONDS, NO_LABELS
+
+morphine_path = "examples/element_files/morphine.mol"
+
+
+def test_bonds_are_classified_before_atoms():
+    molecule = MMoleculeObject.from_mol_file(morphine_path)
+    from_atoms, to_atoms, types, kinds = molecule.bond_arrays
+
+    # Only the wedge bond 8-20 is drawn from the bonds with hydrogens
+    assert len(molecule.bonds) == len(kinds) == 26
+    hydrogen_bond = molecule.bonds[
+        np.flatnonzero((from_atoms == 8) & (to_atoms == 20))[0]
+    ]
+    assert isinstance(hydrogen_bond, PlainCramBond)
+    assert hydrogen_bond.type == 1
+    assert molecule.atoms_by_index[20].representation == "complete"
+    assert np.count_nonzero(kinds == PLAIN_CRAM_BOND) == 3
+
+    # Bonds use the atoms that are in the molecule
+    for bond in molecule.bonds:
+        assert bond.from_atom is molecule.atoms_by_index[bond.from_atom.index]
+        assert bond.to_atom is molecule.atoms_by_index[bond.to_atom.index]
+
+
+def test_atom_bonds_index():
+    molecule = MMoleculeObject.from_mol_file(morphine_path)
+
+    for index, atom in molecule.atoms_by_index.items():
+        assert all(bond.atom_is_in_bond(atom) for bond in molecule.get_atom_bonds(index))
+    assert len(molecule.get_atom_bonds(15)) == 3
+
+    # Renamed atoms replace the old ones everywhere
+    for index in (17, 18):
+        hydroxyl = molecule.atoms_by_index[index]
+        assert hydroxyl.element in ("OH", "HO")
+        assert molecule.atoms[index] is hydroxyl
+        (bond,) = molecule.get_atom_bonds(index)
+        assert hydroxyl in bond.atoms_in_bond()
+
+
+def test_labels_are_copied_from_cache(monkeypatch):
+    labels.clear_labels()
+    monkeypatch.setattr(labels, "LABEL_CACHE_SIZE", 2)
+
+    first = labels.get_label("O", scale=0.8)
+    second = labels.get_label("O", scale=0.8)
+    assert first is not second
+    np.testing.assert_allclose(first.get_all_points(), second.get_all_points())
+
+    labels.get_label("N")
+    labels.get_label("S")
+    assert list(labels._labels) == [("N", "", "NORMAL", 1), ("S", "", "NORMAL", 1)]
+
+
+def test_number_labels_are_made_of_digit_glyphs():
+    points, _, _, _ = labels.get_digit_glyphs()
+    label = labels.get_number_label(105)
+
+    assert len(label.points) == sum(len(points[digit]) for digit in "105")
+    assert np.isclose(label.width, MarkupText("105").width, rtol=0.05)
+    assert np.isclose(labels.get_number_label(105, scale=0.5).width, label.width / 2)
+
+
+def test_only_the_bond_subtype_is_created():
+    assert BaseMBondObject.subtype_for("complete", "skeleton") == "shorter_from"
+    assert BaseMBondObject.subtype_for("over_bond", "complete") is False
+
+    oxygen = MAtomObject(coords=np.array([0.0, 0.0, 0.0]), element="O")
+    carbon = MAtomObject(coords=np.array([1.0, 0.0, 0.0]), element="C")
+    bond = DoubleBond(oxygen, carbon, type=2)
+
+    assert bond.subtype == "shorter_from"
+    assert len(bond.bond) == 2
+
+
+def test_merged_bonds():
+    molecule = MMoleculeObject.from_mol_file(morphine_path)
+    merged = MMoleculeObject.from_mol_file(morphine_path, merge_bonds=True)
+
+    # All the bonds but the 3 wedges are a single mobject
+    assert len(merged.submobjects[1]) == 1 + 3
+    assert len(merged.bond_point_ranges) == len(merged.bonds) - 3
+
+    for index, (start, end) in merged.bond_point_ranges.items():
+        bond_points = np.concatenate(
+            [line.points for line in molecule.bonds[index].family_members_with_points()]
+        )
+        np.testing.assert_allclose(merged.merged_bonds.points[start:end], bond_points)
+        np.testing.assert_allclose(merged.get_merged_bond(index).points, bond_points)
+
+
+def test_level_of_detail():
+    assert MMoleculeObject.choose_level_of_detail(100) == FULL_DETAIL
+    assert MMoleculeObject.choose_level_of_detail(5000) == SIMPLE_BONDS
+    assert MMoleculeObject.choose_level_of_detail(100, target_scale=0.01) == NO_LABELS
+
+    molecule = MMoleculeObject.from_mol_file(morphine_path, level_of_detail=NO_LABELS)
+    kinds = molecule.bond_arrays[3]
+    assert set(kinds.tolist()) == {SIMPLE_BOND, PLAIN_CRAM_BOND}
+    assert all(atom.representation == "skeleton" for atom in molecule.atoms)
+
+    with pytest.raises(ValueError, match="'auto', 0, 1, 2"):
+        MMoleculeObject.from_mol_file(morphine_path, level_of_detail="full")
+
+
+def test_molecules_are_copied_from_prototypes():
+    first = MMoleculeObject.from_mol_file(morphine_path)
+    second = MMoleculeObject.from_mol_file(morphine_path)
+
+    assert first is not second
+    np.testing.assert_allclose(first.get_all_points(), second.get_all_points())
+    for index, atom in second.atoms_by_index.items():
+        assert second.atoms[index] is atom
+        assert atom is not first.atoms_by_index[index]
+    for bond in second.bonds:
+        assert bond.from_atom is second.atoms_by_index[bond.from_atom.index]
+        assert bond.to_atom is second.atoms_by_index[bond.to_atom.index]
+        assert bond in second.get_atom_bonds(bond.from_atom.index)
+
+    # Different arguments are different prototypes
+    numbered = MMoleculeObject.from_mol_file(morphine_path, add_atoms_numbering=True)
+    assert len(numbered.submobjects) == len(first.submobjects) + 1
+
+
+def test_update_coordinates():
+    molecule = MMoleculeObject.from_mol_file(morphine_path)
+    coords = np.array([atom.coords for atom in molecule.atoms_by_index.values()])
+    bond_points = [bond.get_all_points().copy() for bond in molecule.bonds]
+    label_center = molecule.atoms_by_index[17].get_center()
+
+    coords[16] += [1.0, 0.0, 0.0]
+    molecule.update_coordinates(coords)
+
+    np.testing.assert_allclose(
+        molecule.atoms_by_index[17].get_center(), label_center + [1.0, 0.0, 0.0]
+    )
+    (moved_bond,) = molecule.get_atom_bonds(17)
+    for bond, points in zip(molecule.bonds, bond_points):
+        if bond is moved_bond:
+            assert not np.allclose(bond.get_all_points(), points)
+        else:
+            np.testing.assert_allclose(bond.get_all_points(), points)
+
+
+def test_update_coordinates_after_transformations():
+    for merge_bonds in (False, True):
+        updated_first = MMoleculeObject.from_mol_file(
+            morphine_path, merge_bonds=merge_bonds
+        )
+        transformed_first = updated_first.copy()
+        coords = np.array(
+            [atom.coords for atom in updated_first.atoms_by_index.values()]
+        )
+        coords[16] += [1.0, 0.5, 0.0]
+
+        def transform(molecule):
+            return (
+                molecule.scale(2, about_point=ORIGIN)
+                .rotate(PI / 3, about_point=ORIGIN)
+                .shift(3 * LEFT)
+            )
+
+        transform(updated_first.update_coordinates(coords))
+        transform(transformed_first).update_coordinates(coords)
+
+        np.testing.assert_allclose(
+            transformed_first.get_all_points(), updated_first.get_all_points()
+        )
+
+
+def assert_ring_double_bonds_are_inside(molecule):
+    ring_double_bonds = [
+        bond
+        for bond in molecule.bonds
+        if isinstance(bond, DoubleBond) and bond.side
+    ]
+    assert ring_double_bonds
+    for bond in ring_double_bonds:
+        from_index, to_index = bond.from_atom.index, bond.to_atom.index
+        ring_index = molecule.bond_rings[
+            (min(from_index, to_index), max(from_index, to_index))
+        ]
+        center = molecule.ring_centers[ring_index]
+        long_line, short_line = bond.no_subtype()
+        assert np.linalg.norm(short_line.get_center() - center) < np.linalg.norm(
+            long_line.get_center() - center
+        )
+
+
+def test_ring_double_bonds_are_drawn_inside():
+    molecule = MMoleculeObject.from_mol_file(morphine_path)
+    assert [len(ring) for ring in molecule.rings] == [5, 6, 6, 6, 6]
+    assert_ring_double_bonds_are_inside(molecule)
+
+    # Mirrored coordinates move every second line to the other side
+    sides = [bond.side for bond in molecule.bonds if isinstance(bond, DoubleBond)]
+    coords = np.array([atom.coords for atom in molecule.atoms_by_index.values()])
+    molecule.update_coordinates(coords * [-1, 1, 1])
+
+    assert_ring_double_bonds_are_inside(molecule)
+    assert [
+        bond.side for bond in molecule.bonds if isinstance(bond, DoubleBond)
+    ] == [-side for side in sides]
@@ -0,0 +1,72 @@
+import os
+
+import numpy as np
+import pytest
+from manim_chemistry import (
+    cached_mol_array_parser,
+    clear_molecule_cache,
+    mol_parser,
+    molecule_cache_stats,
+)
+from manim_chemistry.utils import molecule_cache
+
+element_files_path = "examples/element_files"
+
+
+@pytest.fixture
+def molecule_cache_dir(cache_dir, monkeypatch):
+    monkeypatch.setattr(molecule_cache, "MIN_CACHED_FILE_SIZE", 0)
+    clear_molecule_cache()
+
+    return cache_dir / "molecules"
+
+
+def test_cached_molecules_are_loaded_from_the_cache(molecule_cache_dir):
+    path = f"{element_files_path}/morphine.mol"
+    first = cached_mol_array_parser(path)
+    second = cached_mol_array_parser(path)
+
+    stats = molecule_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["directory"] == molecule_cache_dir
+
+    atoms, bonds = mol_parser(path)
+    np.testing.assert_equal(second.atoms_dict, atoms)
+    assert second.bonds_dict == bonds
+    assert second.name == first.name
+
+
+def test_molecule_cache_size_limit(molecule_cache_dir, monkeypatch):
+    cached_mol_array_parser(f"{element_files_path}/morphine.mol")
+    monkeypatch.setenv("MANIM_CHEMISTRY_MOLECULE_CACHE_SIZE", "1")
+    cached_mol_array_parser(f"{element_files_path}/heme_group.mol")
+
+    stats = molecule_cache_stats()
+    assert (stats["entries"], stats["evictions"]) == (1, 1)
+
+    assert clear_molecule_cache() == 1
+    assert molecule_cache_stats()["entries"] == 0
+
+
+def test_only_molecules_over_the_size_threshold_are_cached(
+    molecule_cache_dir, monkeypatch
+):
+    heme = f"{element_files_path}/heme_group.mol"
+    monkeypatch.setattr(
+        molecule_cache, "MIN_CACHED_FILE_SIZE", os.path.getsize(heme)
+    )
+    for _ in range(2):
+        cached_mol_array_parser(heme)
+        cached_mol_array_parser(f"{element_files_path}/morphine.mol")
+
+    stats = molecule_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+@pytest.mark.parametrize("size", ["lots", "-1"])
+def test_invalid_molecule_cache_size(size, monkeypatch):
+    monkeypatch.setenv("MANIM_CHEMISTRY_MOLECULE_CACHE_SIZE", size)
+    with pytest.warns(UserWarning, match="MANIM_CHEMISTRY_MOLECULE_CACHE_SIZE"):
+        max_size = molecule_cache.molecule_cache_size()
+
+    assert max_size == molecule_cache.DEFAULT_MOLECULE_CACHE_SIZE
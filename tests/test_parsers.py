@@ -0,0 +1,179 @@
+import multiprocessing
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+from manim_chemistry import load_molecules, mol_array_parser, mol_parser, sdf_parser
+
+element_files_path = "examples/element_files"
+
+
+@pytest.fixture
+def sdf_file(tmp_path):
+    records = []
+    for name in ("morphine", "dimethylpropane"):
+        with open(f"{element_files_path}/{name}.mol") as mol_file:
+            mol_block = mol_file.read().split("M  END")[0] + "M  END"
+        records.append(f"{mol_block}\n>  <NAME>\n{name}\n\n> <ID>\n{len(records)}\n\n$$$$\n")
+
+    sdf_path = tmp_path / "molecules.sdf"
+    sdf_path.write_text("".join(records))
+
+    return sdf_path
+
+
+def test_sdf_parser(sdf_file):
+    records = list(sdf_parser(sdf_file))
+
+    assert [record.data for record in records] == [
+        {"NAME": "morphine", "ID": "0"},
+        {"NAME": "dimethylpropane", "ID": "1"},
+    ]
+    for record, name in zip(records, ("morphine", "dimethylpropane")):
+        atoms, bonds = mol_parser(f"{element_files_path}/{name}.mol")
+        np.testing.assert_equal(record.atoms, atoms)
+        np.testing.assert_equal(record.bonds, bonds)
+
+
+def test_mol_array_parser():
+    molecule = mol_array_parser(f"{element_files_path}/dimethylpropane.mol")
+
+    assert molecule.coords.shape == (17, 3)
+    assert molecule.number_of_bonds == 16
+    assert molecule.elements[:6].tolist() == ["C", "C", "C", "C", "C", "H"]
+    np.testing.assert_equal(molecule.neighbours(0), [1, 2, 3, 4])
+    np.testing.assert_equal(molecule.neighbours(1), [0, 5, 6, 7])
+    assert molecule.degrees().sum() == 2 * molecule.number_of_bonds
+
+
+def test_mol_parser_reads_fixed_width_columns(tmp_path):
+    # Chain of 120 carbons. Atom numbers above 99 fill their 3 columns, so
+    # they are glued together with the previous field.
+    number_of_atoms = 120
+    atom_lines = [
+        f"{index:>10.4f}{-index:>10.4f}{0:>10.4f} C   0  0  0  0  0  0"
+        for index in range(number_of_atoms)
+    ]
+    bond_lines = [
+        f"{index:>3}{index + 1:>3}{1:>3}{index % 2:>3}"
+        for index in range(1, number_of_atoms)
+    ]
+    counts_line = f"{number_of_atoms:>3}{number_of_atoms - 1:>3}  0  0  0  0            999 V2000"
+    mol_path = tmp_path / "chain.mol"
+    mol_path.write_text(
+        "\n".join(["chain", "", "", counts_line, *atom_lines, *bond_lines, "M  END"])
+    )
+
+    molecule = mol_array_parser(mol_path)
+    assert molecule.number_of_atoms == number_of_atoms
+    np.testing.assert_equal(molecule.coords[-1], [119, -119, 0])
+    np.testing.assert_equal(molecule.neighbours(100), [99, 101])
+    np.testing.assert_equal(molecule.bond_stereo[:4], [1, 0, 1, 0])
+
+    atoms, bonds = mol_parser(mol_path)
+    assert bonds[110] == [{"to": 111, "type": "1", "stereo": 0}]
+    assert atoms[120]["bond_to"] == {119: "C"}
+
+
+def test_v3000_mol_parser(tmp_path):
+    v2000_molecule = mol_array_parser(f"{element_files_path}/dimethylpropane.mol")
+    # Atom ids don't need to start at 1 and long lines continue after a -
+    atom_lines = [
+        f"M  V30 {index + 10} {element} {x:.4f} {y:.4f} -\nM  V30 {z:.4f} 0"
+        for index, (element, (x, y, z)) in enumerate(
+            zip(v2000_molecule.elements, v2000_molecule.coords)
+        )
+    ]
+    bond_lines = [
+        f"M  V30 {index + 1} {bond_type} {from_atom + 10} {to_atom + 10} CFG={index % 4}"
+        for index, (from_atom, to_atom, bond_type) in enumerate(
+            zip(v2000_molecule.bond_from, v2000_molecule.bond_to, v2000_molecule.bond_types)
+        )
+    ]
+    mol_path = tmp_path / "dimethylpropane_v3000.mol"
+    mol_path.write_text(
+        "\n".join(
+            [
+                "dimethylpropane",
+                "",
+                "",
+                "  0  0  0     0  0            999 V3000",
+                "M  V30 BEGIN CTAB",
+                f"M  V30 COUNTS {len(atom_lines)} {len(bond_lines)} 0 0 0",
+                "M  V30 BEGIN ATOM",
+                *atom_lines,
+                "M  V30 END ATOM",
+                "M  V30 BEGIN BOND",
+                *bond_lines,
+                "M  V30 END BOND",
+                "M  V30 END CTAB",
+                "M  END",
+            ]
+        )
+    )
+
+    molecule = mol_array_parser(mol_path)
+    np.testing.assert_allclose(molecule.coords, v2000_molecule.coords)
+    np.testing.assert_equal(molecule.elements, v2000_molecule.elements)
+    np.testing.assert_equal(molecule.adjacency_indices, v2000_molecule.adjacency_indices)
+    np.testing.assert_equal(molecule.bond_stereo[:4], [0, 1, 4, 6])
+
+    atoms, _ = mol_parser(mol_path)
+    v2000_atoms, _ = mol_parser(f"{element_files_path}/dimethylpropane.mol")
+    assert [atom["bond_to"] for atom in atoms.values()] == [
+        atom["bond_to"] for atom in v2000_atoms.values()
+    ]
+
+
+def test_load_molecules():
+    paths = [
+        f"{element_files_path}/morphine.mol",
+        f"{element_files_path}/missing.mol",
+        f"{element_files_path}/dimethylpropane.mol",
+    ]
+    results = load_molecules(paths, workers=2)
+
+    assert [result.path for result in results] == paths
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert results[1].molecule is None
+    for result in (results[0], results[2]):
+        assert result.error is None
+        assert result.bonds == mol_parser(result.path)[1]
+
+
+class UnpicklableError(Exception):
+    def __reduce__(self):
+        raise TypeError("can't pickle")
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers only see the patched parser when they are forked",
+)
+def test_load_molecules_survives_worker_failures(monkeypatch):
+    from manim_chemistry.utils import molecule_loader
+
+    parser = molecule_loader.cached_mol_array_parser
+
+    def failing_parser(path):
+        if "dimethylpropane" in path:
+            raise UnpicklableError(path)
+        if "crash" in path:
+            os._exit(1)
+        return parser(path)
+
+    monkeypatch.setattr(molecule_loader, "cached_mol_array_parser", failing_parser)
+
+    paths = [
+        f"{element_files_path}/morphine.mol",
+        f"{element_files_path}/dimethylpropane.mol",
+    ]
+    results = load_molecules(paths, workers=2)
+    assert results[0].error is None
+    assert isinstance(results[1].error, UnpicklableError)
+
+    results = load_molecules(paths + ["crash.mol"], workers=2)
+    assert [result.path for result in results] == paths + ["crash.mol"]
+    assert results[2].molecule is None
+    assert isinstance(results[2].error, BrokenProcessPool)
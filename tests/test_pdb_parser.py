@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+from manim_chemistry import mmcif_parser, pdb_parser
+
+PDB_FILE = """\
+HEADER    TEST STRUCTURE                          01-JAN-00   1TST
+ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00  0.00           N
+ATOM      2  CA  ALA A   1      11.639   6.071  -5.147  1.00  0.00           C
+ATOM      3  C  AALA A   1      13.140   6.240  -5.200  0.50  0.00           C
+ATOM      4  C  BALA A   1      13.100   6.300  -5.300  0.50  0.00           C
+ATOM      5  N   GLY B   2      13.845   5.500  -4.320  1.00  0.00           N
+HETATM    6 FE   HEM A 101      15.000   5.000  -3.000  1.00  0.00          FE
+HETATM    7  O   HOH A 201      16.000   5.000  -3.000  1.00  0.00           O
+CONECT    1    2
+CONECT    2    1    3    4
+CONECT    6    7
+END
+"""
+
+MMCIF_FILE = """\
+data_1TST
+loop_
+_atom_site.group_PDB
+_atom_site.id
+_atom_site.type_symbol
+_atom_site.label_atom_id
+_atom_site.label_alt_id
+_atom_site.label_comp_id
+_atom_site.label_asym_id
+_atom_site.label_seq_id
+_atom_site.Cartn_x
+_atom_site.Cartn_y
+_atom_site.Cartn_z
+_atom_site.auth_seq_id
+_atom_site.auth_asym_id
+_atom_site.pdbx_PDB_model_num
+ATOM 1 N N . ALA A 1 11.104 6.134 -6.504 1 A 1
+ATOM 2 C CA . ALA A 1 11.639 6.071 -5.147 1 A 1
+ATOM 3 C C A ALA A 1 13.140 6.240 -5.200 1 A 1
+ATOM 4 C C B ALA A 1 13.100 6.300 -5.300 1 A 1
+ATOM 5 N N . GLY B 2 13.845 5.500 -4.320 2 B 1
+HETATM 6 FE FE . HEM C . 15.000 5.000 -3.000 101 A 1
+HETATM 7 O O . HOH D . 16.000 5.000 -3.000 201 A 1
+ATOM 8 N N . ALA A 1 0.0 0.0 0.0 1 A 2
+#
+"""
+
+
+@pytest.fixture(params=["pdb", "mmcif"])
+def structure(request, tmp_path):
+    if request.param == "pdb":
+        path = tmp_path / "structure.pdb"
+        path.write_text(PDB_FILE)
+        return path, pdb_parser
+
+    path = tmp_path / "structure.cif"
+    path.write_text(MMCIF_FILE)
+    return path, mmcif_parser
+
+
+def test_structure_parser(structure):
+    path, parser = structure
+    molecule = parser(path)
+
+    assert molecule.name == "1TST"
+    assert molecule.elements.tolist() == ["N", "C", "C", "N", "Fe", "O"]
+    np.testing.assert_allclose(molecule.coords[2], [13.140, 6.240, -5.200])
+
+
+def test_structure_parser_selection(structure):
+    path, parser = structure
+
+    assert parser(path, chains=["B"]).elements.tolist() == ["N"]
+    assert parser(path, residues=["HEM", 2]).elements.tolist() == ["N", "Fe"]
+    assert parser(path, altloc=None).number_of_atoms == 7
+    assert parser(path, hetero_atoms=False).number_of_atoms == 4
+
+
+def test_pdb_conect_bonds(tmp_path):
+    path = tmp_path / "structure.pdb"
+    path.write_text(PDB_FILE)
+
+    molecule = pdb_parser(path)
+    assert list(zip(molecule.bond_from, molecule.bond_to)) == [(0, 1), (1, 2), (4, 5)]
+
+    # Bonds to atoms that aren't selected are dropped
+    assert pdb_parser(path, residues=["ALA"]).number_of_bonds == 2
+
+
+def test_pdb_elements_from_atom_names(tmp_path):
+    # Old files without element column (77-78)
+    path = tmp_path / "structure.pdb"
+    path.write_text(
+        "ATOM      1  CA  LEU A   1       0.000   0.000   0.000\n"
+        "ATOM      2  HG  LEU A   1       0.000   0.000   0.000\n"
+        "ATOM      3 HG12 VAL A   2       0.000   0.000   0.000\n"
+        "ATOM      4 1HG1 VAL A   2       0.000   0.000   0.000\n"
+        "HETATM    5 CA    CA A 101       0.000   0.000   0.000\n"
+        "HETATM    6 HG    HG A 102       0.000   0.000   0.000\n"
+        "HETATM    7 FE   HEM A 103       0.000   0.000   0.000\n"
+    )
+
+    assert pdb_parser(path).elements.tolist() == ["C", "H", "H", "H", "Ca", "Hg", "Fe"]
@@ -0,0 +1,141 @@
+import random
+
+import numpy as np
+from manim_chemistry import find_rings, mol_array_parser
+
+
+def ring_bonds(ring):
+    return {frozenset(pair) for pair in zip(ring, ring[1:] + ring[:1])}
+
+
+def test_single_ring():
+    rings = find_rings([0, 1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 0])
+
+    assert len(rings) == 1
+    assert sorted(rings[0]) == [0, 1, 2, 3, 4, 5]
+    assert ring_bonds(rings[0]) == {frozenset((i, (i + 1) % 6)) for i in range(6)}
+
+
+def test_fused_rings():
+    # Naphthalene: two rings sharing the bond 0-5, not the ring around both
+    bond_from = [0, 1, 2, 3, 4, 5, 5, 6, 7, 8, 9]
+    bond_to = [1, 2, 3, 4, 5, 0, 6, 7, 8, 9, 0]
+
+    assert sorted(map(sorted, find_rings(bond_from, bond_to))) == [
+        [0, 1, 2, 3, 4, 5],
+        [0, 5, 6, 7, 8, 9],
+    ]
+
+
+def test_cage():
+    # Cubane: 12 bonds and 8 atoms make 5 independent four-membered rings
+    edges = [
+        (a, b)
+        for a in range(8)
+        for b in range(a + 1, 8)
+        if bin(a ^ b).count("1") == 1
+    ]
+    rings = find_rings(*zip(*edges))
+
+    assert [len(ring) for ring in rings] == [4] * 5
+
+
+def test_fused_ring_sheet():
+    # A 30 x 30 grid has 29 x 29 squares and no bigger ring is needed
+    size = 30
+    index = np.arange(size * size).reshape(size, size)
+    bond_from = np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()])
+    bond_to = np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()])
+
+    assert [len(ring) for ring in find_rings(bond_from, bond_to)] == [4] * 29**2
+
+
+def test_molecule_rings():
+    molecule = mol_array_parser("examples/element_files/morphine.mol")
+    rings = find_rings(molecule.bond_from, molecule.bond_to)
+
+    assert [len(ring) for ring in rings] == [5, 6, 6, 6, 6]
+    bonds = set(
+        zip(
+            np.minimum(molecule.bond_from, molecule.bond_to).tolist(),
+            np.maximum(molecule.bond_from, molecule.bond_to).tolist(),
+        )
+    )
+    for ring in rings:
+        assert ring_bonds(ring) <= {frozenset(bond) for bond in bonds}
+
+
+def test_no_rings():
+    # 2,2-dimethylpropane
+    assert find_rings([0, 0, 0, 0], [1, 2, 3, 4]) == []
+
+
+def minimum_ring_sizes(edges):
+    """
+    Sizes of a smallest set of smallest rings, taking every ring of the
+    graph from the smallest while they are independent.
+    """
+    neighbours = {}
+    for a, b in edges:
+        neighbours.setdefault(a, set()).add(b)
+        neighbours.setdefault(b, set()).add(a)
+
+    cycles = set()
+
+    def extend(path):
+        for neighbour in neighbours[path[-1]]:
+            if neighbour == path[0] and len(path) > 2:
+                cycles.add(frozenset(ring_bonds(path)))
+            elif neighbour > path[0] and neighbour not in path:
+                extend(path + [neighbour])
+
+    for atom in neighbours:
+        extend([atom])
+
+    basis = {}
+    sizes = []
+    bits = {frozenset(edge): 1 << position for position, edge in enumerate(edges)}
+    for cycle in sorted(cycles, key=len):
+        vector = sum(bits[bond] for bond in cycle)
+        while vector:
+            pivot = vector.bit_length() - 1
+            if pivot not in basis:
+                basis[pivot] = vector
+                sizes.append(len(cycle))
+                break
+            vector ^= basis[pivot]
+
+    return sorted(sizes)
+
+
+def assert_smallest_rings(edges):
+    rings = find_rings(*zip(*edges))
+    edge_set = {frozenset(edge) for edge in edges}
+    for ring in rings:
+        assert len(set(ring)) == len(ring)
+        assert ring_bonds(ring) <= edge_set
+
+    assert sorted(len(ring) for ring in rings) == minimum_ring_sizes(edges)
+
+
+def test_rings_are_the_smallest():
+    # The shortest ring through every bond alone gives 8 triangles and 2
+    # four-membered rings here
+    assert_smallest_rings(
+        [
+            (0, 2), (0, 3), (0, 4), (0, 6), (1, 4), (1, 5), (1, 7), (2, 3), (2, 5),
+            (2, 6), (2, 7), (3, 4), (3, 6), (4, 6), (4, 7), (5, 6), (6, 7),
+        ]
+    )
+
+    generator = random.Random(0)
+    for _ in range(200):
+        size = generator.randint(4, 8)
+        edges = [
+            (a, b)
+            for a in range(size)
+            for b in range(a + 1, size)
+            if generator.random() < 0.5
+        ]
+        if edges:
+            assert_smallest_rings(edges)